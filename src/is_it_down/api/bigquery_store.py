@@ -8,6 +8,7 @@ import json
 from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 from urllib.parse import quote
 from uuid import uuid4
@@ -220,10 +221,10 @@ def _sort_service_summaries_by_views(
     Returns:
         The resulting value.
     """
-    return sorted(
-        summaries,
-        key=lambda summary: (-view_counts_by_slug.get(summary.slug, 0), summary.slug),
-    )
+    # Two stable single-key sorts order by views then slug without building a key tuple per summary.
+    ordered = sorted(summaries, key=attrgetter("slug"))
+    ordered.sort(key=lambda summary: view_counts_by_slug.get(summary.slug, 0), reverse=True)
+    return ordered
 
 
 @lru_cache
@@ -239,7 +240,7 @@ def discovered_service_definitions() -> dict[str, ServiceDefinition]:
     for checker_cls in discovered:
         checker = checker_cls()
         check_weights: dict[str, float] = {}
-        checks = checker.resolve_check_weights(list(checker.build_checks()))
+        checks = checker.resolve_check_weights(checker.build_checks())
         for check in checks:
             check_weights[check.check_key] = float(check.weight or 1.0)
 
@@ -1,11 +1,14 @@
 """Provide functionality for `is_it_down.api.service_tracking_middleware`."""
 
+import re
+
 from fastapi import FastAPI, Request, Response
 from starlette.background import BackgroundTask, BackgroundTasks
 
 from is_it_down.api.bigquery_store import get_bigquery_api_store
 
-_SERVICES_PREFIX_PARTS = ("v1", "services")
+# Empty path segments are ignored, so repeated or missing slashes around the parts still match.
+_SERVICE_DETAIL_PATH_RE = re.compile(r"/*v1/+services/+([^/]+)/*")
 _NON_DETAIL_SEGMENTS = frozenset({"uptime", "checker-trends"})
 
 
@@ -18,13 +21,11 @@ def _service_slug_from_path(path: str) -> str | None:
     Returns:
         The resulting value.
     """
-    parts = tuple(part for part in path.split("/") if part)
-    if len(parts) != 3:
-        return None
-    if parts[:2] != _SERVICES_PREFIX_PARTS:
+    match = _SERVICE_DETAIL_PATH_RE.fullmatch(path)
+    if match is None:
         return None
-    slug = parts[2]
-    if not slug or slug in _NON_DETAIL_SEGMENTS:
+    slug = match.group(1)
+    if slug in _NON_DETAIL_SEGMENTS:
         return None
     return slug
 
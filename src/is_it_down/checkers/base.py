@@ -7,7 +7,7 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from math import isclose
+from math import fsum, isclose
 
 import httpx
 from pydantic import BaseModel
@@ -69,6 +69,25 @@ class BaseCheck(ABC):
         async with _proxy_client_for_check(base_client=client, proxy_url=proxy_url) as proxy_client:
             yield proxy_client
 
+    def timeout_result(self, observed_at: datetime) -> CheckResult:
+        """Timeout result.
+        
+        Args:
+            observed_at: The observed at value.
+        
+        Returns:
+            The `down` result recorded when the check exceeds `timeout_seconds`.
+        """
+        return _enrich_check_result_metadata(
+            CheckResult(
+                check_key=self.check_key,
+                status="down",
+                observed_at=observed_at,
+                error_code="TIMEOUT",
+                error_message=f"Check timed out after {self.timeout_seconds}s",
+            )
+        )
+
     async def execute(self, client: httpx.AsyncClient) -> CheckResult:
         """Execute.
         
@@ -98,15 +117,7 @@ class BaseCheck(ABC):
                 )
             )
         except TimeoutError:
-            return _enrich_check_result_metadata(
-                CheckResult(
-                    check_key=self.check_key,
-                    status="down",
-                    observed_at=observed_at,
-                    error_code="TIMEOUT",
-                    error_message=f"Check timed out after {self.timeout_seconds}s",
-                )
-            )
+            return self.timeout_result(observed_at)
         except Exception as exc:
             return _enrich_check_result_metadata(
                 CheckResult(
@@ -275,7 +286,7 @@ class BaseServiceChecker(ABC):
                 f"when all checks set weight (sum={explicit_sum:.6f})."
             )
 
-        total = sum((check.weight or 0.0) for check in checks)
+        total = fsum((check.weight or 0.0) for check in checks)
         if not isclose(total, 1.0, rel_tol=1e-9, abs_tol=1e-9):
             raise ValueError(f"{self.service_key} resolved check weights must sum to 1.0 (sum={total:.6f}).")
 
@@ -299,7 +310,7 @@ class BaseServiceChecker(ABC):
             The resulting value.
         """
         self.dependency_service_keys()
-        checks = self.resolve_check_weights(list(self.build_checks()))
+        checks = self.resolve_check_weights(self.build_checks())
         if not checks:
             return ServiceRunResult(service_key=self.service_key, check_results=[])
 
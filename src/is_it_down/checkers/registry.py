@@ -1,8 +1,8 @@
 """Provide functionality for `is_it_down.checkers.registry`."""
 
 import importlib
-import inspect
 import pkgutil
+import sys
 from collections.abc import Iterator
 
 from is_it_down.checkers.base import BaseCheck, BaseServiceChecker
@@ -88,9 +88,10 @@ class CheckerRegistry:
             The values produced by the generator.
         """
         for module_name in self.discover_under(package_name):
-            module = importlib.import_module(module_name)
-            for _, loaded in inspect.getmembers(module, inspect.isclass):
-                if not issubclass(loaded, BaseServiceChecker):
+            module = sys.modules[module_name]
+            # A plain namespace scan avoids inspect.getmembers' sort and per-name getattr.
+            for loaded in list(vars(module).values()):
+                if not isinstance(loaded, type) or not issubclass(loaded, BaseServiceChecker):
                     continue
                 if loaded is BaseServiceChecker:
                     continue
@@ -0,0 +1,41 @@
+"""Provide functionality for `is_it_down.core.event_loop`."""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+
+    _UVLOOP_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised on platforms without uvloop wheels.
+    _UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Event loop factory.
+
+    Returns:
+        `uvloop.new_event_loop` when uvloop is installed, otherwise `None` for the default loop.
+    """
+    if _UVLOOP_AVAILABLE:
+        return uvloop.new_event_loop
+    return None
+
+
+def run_entrypoint(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a script entrypoint coroutine on a fresh event loop.
+
+    Uses uvloop when available, which lowers per-call overhead for the HTTP and database I/O done by
+    the checker, scheduler and worker processes.
+
+    Args:
+        coro: The coroutine to run to completion.
+
+    Returns:
+        The coroutine result.
+    """
+    with asyncio.Runner(debug=False, loop_factory=_event_loop_factory()) as runner:
+        return runner.run(coro)
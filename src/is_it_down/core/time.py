@@ -2,6 +2,8 @@
 
 from datetime import timedelta
 
+_WINDOW_UNITS = {"h": timedelta(hours=1), "d": timedelta(days=1), "m": timedelta(minutes=1)}
+
 
 def parse_history_window(raw_window: str) -> timedelta:
     """Parse history window.
@@ -15,7 +17,7 @@ def parse_history_window(raw_window: str) -> timedelta:
     Raises:
         ValueError: If an error occurs while executing this function.
     """
-    unit = raw_window[-1]
+    unit = raw_window[-1:]
     value_str = raw_window[:-1]
     if not value_str.isdigit():
         raise ValueError("Window must start with an integer.")
@@ -24,11 +26,7 @@ def parse_history_window(raw_window: str) -> timedelta:
     if value <= 0:
         raise ValueError("Window must be greater than zero.")
 
-    if unit == "h":
-        return timedelta(hours=value)
-    if unit == "d":
-        return timedelta(days=value)
-    if unit == "m":
-        return timedelta(minutes=value)
-
-    raise ValueError("Window must end with h, d, or m.")
+    unit_delta = _WINDOW_UNITS.get(unit)
+    if unit_delta is None:
+        raise ValueError("Window must end with h, d, or m.")
+    return value * unit_delta
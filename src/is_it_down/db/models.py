@@ -15,6 +15,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -86,6 +87,17 @@ class CheckJob(Base, TimestampMixin):
     __table_args__ = (
         UniqueConstraint("idempotency_key", name="uq_check_job_idempotency"),
         Index("ix_check_jobs_sched_status", "scheduled_for", "status"),
+        # Back the claim_jobs scan: only claimable rows are indexed, ordered by scheduled_for.
+        Index(
+            "ix_check_jobs_claimable_scheduled_for",
+            "scheduled_for",
+            postgresql_where=text("status IN ('queued', 'leased')"),
+        ),
+        Index(
+            "ix_check_jobs_leased_lease_expires_at",
+            "lease_expires_at",
+            postgresql_where=text("status = 'leased'"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -119,6 +131,27 @@ class CheckRun(Base):
     observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
+class LatestCheckRun(Base):
+    """Represent `LatestCheckRun`.
+
+    Holds the most recent `CheckRun` values for each check so snapshot recomputes read one row per
+    check instead of searching the run history.
+    """
+
+    __tablename__ = "latest_check_runs"
+    __table_args__ = (Index("ix_latest_check_runs_service_id", "service_id"),)
+
+    check_id: Mapped[int] = mapped_column(ForeignKey("service_checks.id", ondelete="CASCADE"), primary_key=True)
+    service_id: Mapped[int] = mapped_column(ForeignKey("services.id", ondelete="CASCADE"), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    http_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    error_code: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 class ServiceSnapshot(Base):
     """Represent `ServiceSnapshot`."""
 
@@ -142,7 +175,16 @@ class Incident(Base, TimestampMixin):
     """Represent `Incident`."""
 
     __tablename__ = "incidents"
-    __table_args__ = (Index("ix_incidents_service_status", "service_id", "status"),)
+    __table_args__ = (
+        Index("ix_incidents_service_status", "service_id", "status"),
+        # At most one open incident per service. Existing databases get it from is-it-down-add-open-incident-index.
+        Index(
+            "ix_incidents_open_per_service",
+            "service_id",
+            unique=True,
+            postgresql_where=text("status = 'open'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     service_id: Mapped[int] = mapped_column(ForeignKey("services.id", ondelete="CASCADE"), nullable=False)
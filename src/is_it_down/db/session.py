@@ -1,16 +1,54 @@
 """Provide functionality for `is_it_down.db.session`."""
 
+import json
 from collections.abc import AsyncIterator
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from is_it_down.db.base import Base
 from is_it_down.settings import get_settings
 
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised in environments without orjson installed.
+    _ORJSON_AVAILABLE = False
+
 _engine: AsyncEngine | None = None
 _sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson, falling back to the stdlib for values orjson rejects.
+
+    Integers wider than 64 bits are written by `json.dumps` so they are stored rather than raising.
+    NaN and Infinity are written as `null`; the stdlib's `NaN` token is not valid PostgreSQL JSON.
+
+    Args:
+        value: The value to serialize.
+
+    Returns:
+        The JSON document as a string.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(value)
+
+
+def _json_engine_kwargs() -> dict[str, Any]:
+    """JSON engine kwargs.
+
+    Returns:
+        orjson-backed JSON serializer hooks, or no overrides when orjson is not installed.
+    """
+    if not _ORJSON_AVAILABLE:
+        return {}
+    return {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+
+
 def get_engine() -> AsyncEngine:
     """Get engine.
     
@@ -20,7 +58,7 @@ def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_async_engine(settings.database_url, pool_pre_ping=True)
+        _engine = create_async_engine(settings.database_url, pool_pre_ping=True, **_json_engine_kwargs())
     return _engine
 
 
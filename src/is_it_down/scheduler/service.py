@@ -12,6 +12,7 @@ from is_it_down.db.models import CheckJob, Service, ServiceCheck
 from is_it_down.db.session import get_sessionmaker
 from is_it_down.logging import configure_logging
 from is_it_down.settings import get_settings
+from is_it_down.worker.queue import notify_jobs_ready
 
 logger = structlog.get_logger(__name__)
 
@@ -136,6 +137,8 @@ async def run_scheduler_loop(session_factory: async_sessionmaker[AsyncSession] |
                     max_attempts=settings.worker_max_attempts,
                     batch_size=settings.scheduler_batch_size,
                 )
+                if queued:
+                    await notify_jobs_ready(session)
                 await session.commit()
 
             logger.info("scheduler.tick", queued=queued)
@@ -0,0 +1,112 @@
+"""Add the one-open-incident-per-service index to an existing database.
+
+`create_all` only builds indexes for tables it creates, so databases created before
+`ix_incidents_open_per_service` was declared need this one-off step.
+"""
+
+from datetime import UTC, datetime
+from typing import Final
+
+import structlog
+from sqlalchemy import func, insert, select, text, update
+
+from is_it_down.core.event_loop import run_entrypoint
+from is_it_down.db.models import Incident, IncidentEvent
+from is_it_down.db.session import get_engine, get_sessionmaker
+from is_it_down.logging import configure_logging
+from is_it_down.settings import get_settings
+
+logger = structlog.get_logger(__name__)
+
+OPEN_INCIDENT_INDEX: Final[str] = "ix_incidents_open_per_service"
+
+_ranked_open_incidents = (
+    select(
+        Incident.id,
+        func.row_number()
+        .over(partition_by=Incident.service_id, order_by=(Incident.started_at.desc(), Incident.id.desc()))
+        .label("rank"),
+    )
+    .where(Incident.status == "open")
+    .subquery()
+)
+# Every open incident except the most recently started one for its service.
+_DUPLICATE_OPEN_INCIDENT_IDS_STMT = select(_ranked_open_incidents.c.id).where(_ranked_open_incidents.c.rank > 1)
+
+_INVALID_INDEX_STMT = text(
+    "SELECT NOT i.indisvalid FROM pg_index AS i "
+    "JOIN pg_class AS c ON c.oid = i.indexrelid WHERE c.relname = :index_name"
+)
+_DROP_INDEX_DDL = text(f"DROP INDEX CONCURRENTLY IF EXISTS {OPEN_INCIDENT_INDEX}")
+_CREATE_INDEX_DDL = text(
+    f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {OPEN_INCIDENT_INDEX} "
+    "ON incidents (service_id) WHERE status = 'open'"
+)
+
+
+async def resolve_duplicate_open_incidents() -> int:
+    """Resolve all but the most recently started open incident of each service.
+
+    Each resolved incident gets a `resolved` event, as the worker writes when a service recovers.
+
+    Returns:
+        The number of incidents resolved.
+    """
+    session_factory = get_sessionmaker()
+    resolved_at = datetime.now(UTC)
+
+    async with session_factory() as session:
+        duplicate_ids = list((await session.scalars(_DUPLICATE_OPEN_INCIDENT_IDS_STMT)).all())
+        if duplicate_ids:
+            await session.execute(
+                update(Incident)
+                .where(Incident.id.in_(duplicate_ids))
+                .values(status="resolved", resolved_at=resolved_at)
+            )
+            await session.execute(
+                insert(IncidentEvent),
+                [
+                    {
+                        "incident_id": incident_id,
+                        "event_type": "resolved",
+                        "payload_json": {"resolved_at": resolved_at.isoformat(), "reason": "duplicate_open_incident"},
+                    }
+                    for incident_id in duplicate_ids
+                ],
+            )
+        await session.commit()
+
+    return len(duplicate_ids)
+
+
+async def create_open_incident_index() -> None:
+    """Create the partial unique index without blocking writes to `incidents`.
+
+    `CREATE INDEX CONCURRENTLY` cannot run inside a transaction, so the statements run in autocommit
+    mode. A failed earlier attempt leaves an invalid index behind, which is dropped and rebuilt.
+    """
+    async with get_engine().connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        if await connection.scalar(_INVALID_INDEX_STMT, {"index_name": OPEN_INCIDENT_INDEX}):
+            await connection.execute(_DROP_INDEX_DDL)
+        await connection.execute(_CREATE_INDEX_DDL)
+
+
+async def add_open_incident_index() -> None:
+    """Resolve duplicate open incidents, then create the one-open-incident-per-service index."""
+    configure_logging(get_settings().log_level)
+
+    resolved_count = await resolve_duplicate_open_incidents()
+    logger.info("open_incident_index.duplicates_resolved", resolved_count=resolved_count)
+
+    await create_open_incident_index()
+    logger.info("open_incident_index.created", index_name=OPEN_INCIDENT_INDEX)
+
+
+def main() -> None:
+    """Run the entrypoint."""
+    run_entrypoint(add_open_incident_index())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 """Provide shared runtime helpers for executing service checker classes."""
 
 import asyncio
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import lru_cache
+from types import MappingProxyType
 
 import httpx
 
@@ -11,6 +14,7 @@ from is_it_down.checkers.registry import registry
 from is_it_down.settings import Settings, get_settings
 
 
+@lru_cache(maxsize=1024)
 def service_checker_path(service_checker_cls: type[BaseServiceChecker]) -> str:
     """Service checker path.
     
@@ -23,8 +27,11 @@ def service_checker_path(service_checker_cls: type[BaseServiceChecker]) -> str:
     return f"{service_checker_cls.__module__}.{service_checker_cls.__name__}"
 
 
-def discover_service_checkers() -> dict[str, type[BaseServiceChecker]]:
+@lru_cache(maxsize=1)
+def discover_service_checkers() -> Mapping[str, type[BaseServiceChecker]]:
     """Discover service checkers.
+
+    The package walk runs once per process; later calls return the cached, read-only mapping.
     
     Returns:
         The resulting value.
@@ -37,7 +44,7 @@ def discover_service_checkers() -> dict[str, type[BaseServiceChecker]]:
         if not service_key:
             continue
         discovered[service_key] = loaded
-    return discovered
+    return MappingProxyType(discovered)
 
 
 def resolve_service_checker_targets(targets: Sequence[str]) -> list[type[BaseServiceChecker]]:
@@ -59,7 +66,7 @@ def resolve_service_checker_targets(targets: Sequence[str]) -> list[type[BaseSer
     resolved: list[type[BaseServiceChecker]] = []
     seen_paths: set[str] = set()
 
-    for target in targets:
+    for target in dict.fromkeys(targets):
         if "." in target:
             loaded = registry.get_service_checker(target)
         else:
@@ -83,6 +90,7 @@ async def execute_service_checkers(
     *,
     concurrent: bool = False,
     concurrency_limit: int | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> list[tuple[type[BaseServiceChecker], ServiceRunResult]]:
     """Execute service checkers.
     
@@ -90,25 +98,50 @@ async def execute_service_checkers(
         service_checker_classes: The service checker classes value.
         concurrent: The concurrent value.
         concurrency_limit: The concurrency limit value.
+        client: An open client to reuse instead of building a checker client; the caller keeps ownership.
     
     Returns:
-        The resulting value.
+        The runs, in the same order as `service_checker_classes`.
     """
     runs: list[tuple[type[BaseServiceChecker], ServiceRunResult]] = []
     async for run in iter_service_checker_runs(
         service_checker_classes,
         concurrent=concurrent,
         concurrency_limit=concurrency_limit,
+        client=client,
     ):
         runs.append(run)
+
+    if concurrent:
+        # Concurrent runs complete out of order; restore the caller's ordering for stable output.
+        positions = {service_checker_cls: index for index, service_checker_cls in enumerate(service_checker_classes)}
+        runs.sort(key=lambda run: positions[run[0]])
     return runs
 
 
+def _concurrency_gate(limit: int, checker_count: int) -> AbstractAsyncContextManager[object]:
+    """Build the context manager that bounds concurrent checker runs.
+
+    A limit that covers every checker can never block, so it gets a no-op context instead of a semaphore.
+
+    Args:
+        limit: The maximum number of checkers allowed to run at once.
+        checker_count: The number of checkers about to run.
+
+    Returns:
+        A semaphore when `limit` is below `checker_count`, otherwise a null context.
+    """
+    if limit < checker_count:
+        return asyncio.Semaphore(limit)
+    return nullcontext()
+
+
 async def iter_service_checker_runs(
     service_checker_classes: Sequence[type[BaseServiceChecker]],
     *,
     concurrent: bool = False,
     concurrency_limit: int | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> AsyncIterator[tuple[type[BaseServiceChecker], ServiceRunResult]]:
     """Iter service checker runs.
 
@@ -116,6 +149,7 @@ async def iter_service_checker_runs(
         service_checker_classes: The service checker classes value.
         concurrent: The concurrent value.
         concurrency_limit: The concurrency limit value.
+        client: An open client to reuse instead of building a checker client; the caller keeps ownership.
 
     Yields:
         The values produced by the generator.
@@ -128,13 +162,16 @@ async def iter_service_checker_runs(
     if concurrent and limit <= 0:
         raise ValueError("concurrency_limit must be greater than 0 in concurrent mode.")
 
-    async with _build_checker_client(settings) as client:
+    client_context: AbstractAsyncContextManager[httpx.AsyncClient] = (
+        _build_checker_client(settings) if client is None else nullcontext(client)
+    )
+    async with client_context as checker_client:
         if not concurrent:
             for service_checker_cls in service_checker_classes:
-                yield service_checker_cls, await service_checker_cls().run_all(client)
+                yield service_checker_cls, await service_checker_cls().run_all(checker_client)
             return
 
-        semaphore = asyncio.Semaphore(limit)
+        gate = _concurrency_gate(limit, len(service_checker_classes))
 
         async def _run_one(
             service_checker_cls: type[BaseServiceChecker],
@@ -147,8 +184,8 @@ async def iter_service_checker_runs(
             Returns:
                 The resulting value.
             """
-            async with semaphore:
-                return service_checker_cls, await service_checker_cls().run_all(client)
+            async with gate:
+                return service_checker_cls, await service_checker_cls().run_all(checker_client)
 
         tasks = [asyncio.create_task(_run_one(service_checker_cls)) for service_checker_cls in service_checker_classes]
         try:
@@ -162,6 +199,39 @@ async def iter_service_checker_runs(
                 await asyncio.gather(*tasks, return_exceptions=True)
 
 
+@lru_cache(maxsize=8)
+def _checker_client_defaults(
+    timeout_seconds: float,
+    user_agent: str,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry_seconds: float,
+) -> tuple[httpx.Timeout, httpx.Limits, Mapping[str, str]]:
+    """Checker client defaults.
+
+    Keyed on the raw setting values, so the cached objects follow any settings reload.
+
+    Args:
+        timeout_seconds: The default HTTP timeout in seconds.
+        user_agent: The User-Agent header value.
+        max_connections: The maximum number of pooled connections.
+        max_keepalive_connections: The maximum number of idle keep-alive connections.
+        keepalive_expiry_seconds: The idle keep-alive expiry in seconds.
+
+    Returns:
+        The timeout, connection limits, and default headers for checker clients.
+    """
+    return (
+        httpx.Timeout(timeout_seconds),
+        httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        ),
+        MappingProxyType({"User-Agent": user_agent}),
+    )
+
+
 def _build_checker_client(settings: Settings) -> BoundedAsyncClient:
     """Build checker client.
 
@@ -171,10 +241,17 @@ def _build_checker_client(settings: Settings) -> BoundedAsyncClient:
     Returns:
         The resulting value.
     """
-    client_timeout = httpx.Timeout(settings.default_http_timeout_seconds)
+    client_timeout, client_limits, client_headers = _checker_client_defaults(
+        settings.default_http_timeout_seconds,
+        settings.user_agent,
+        settings.checker_http_max_connections,
+        settings.checker_http_max_keepalive_connections,
+        settings.checker_http_keepalive_expiry_seconds,
+    )
     return BoundedAsyncClient(
         timeout=client_timeout,
-        headers={"User-Agent": settings.user_agent},
+        limits=client_limits,
+        headers=client_headers,
         follow_redirects=True,
         max_response_body_bytes=settings.checker_max_response_body_bytes,
         max_json_response_body_bytes=settings.checker_max_json_response_body_bytes,
@@ -3,10 +3,10 @@
 import argparse
 import asyncio
 import importlib
-import inspect
 import json
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -89,10 +89,13 @@ def _service_module_path(module_name: str) -> str:
     return f"is_it_down.checkers.services.{module_name}"
 
 
+@lru_cache(maxsize=256)
 def _discover_service_checkers_for_module(
     module_name: str,
-) -> tuple[list[type[BaseServiceChecker]], str | None]:
+) -> tuple[tuple[type[BaseServiceChecker], ...], str | None]:
     """Discover service checkers for module.
+
+    Results are cached per module name, so repeated selections reuse one import and scan.
     
     Args:
         module_name: The module name value.
@@ -105,11 +108,11 @@ def _discover_service_checkers_for_module(
     try:
         module = importlib.import_module(module_path)
     except Exception as exc:
-        return [], f"{exc.__class__.__name__}: {exc}"
+        return (), f"{exc.__class__.__name__}: {exc}"
 
     discovered: list[type[BaseServiceChecker]] = []
-    for _, loaded in inspect.getmembers(module, inspect.isclass):
-        if not issubclass(loaded, BaseServiceChecker):
+    for loaded in list(vars(module).values()):
+        if not isinstance(loaded, type) or not issubclass(loaded, BaseServiceChecker):
             continue
         if loaded is BaseServiceChecker:
             continue
@@ -118,8 +121,8 @@ def _discover_service_checkers_for_module(
         discovered.append(loaded)
 
     if not discovered:
-        return [], "No BaseServiceChecker subclasses found in module."
-    return discovered, None
+        return (), "No BaseServiceChecker subclasses found in module."
+    return tuple(discovered), None
 
 
 def selected_service_checker_classes(
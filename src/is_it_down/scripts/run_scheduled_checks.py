@@ -1,13 +1,12 @@
 """Provide functionality for `is_it_down.scripts.run_scheduled_checks`."""
 
 import argparse
-import asyncio
 import json
 import os
+import secrets
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
 import structlog
 from google.cloud import bigquery
@@ -15,6 +14,7 @@ from google.cloud import bigquery
 from is_it_down.api.cache_warm import warm_api_cache
 from is_it_down.checkers.base import BaseServiceChecker, ServiceRunResult
 from is_it_down.checkers.proxy import clear_proxy_resolution_cache
+from is_it_down.core.event_loop import run_entrypoint
 from is_it_down.logging import configure_logging
 from is_it_down.scripts.checker_runtime import (
     discover_service_checkers,
@@ -27,6 +27,7 @@ from is_it_down.settings import get_settings
 logger = structlog.get_logger(__name__)
 _CLOUD_RUN_TASK_INDEX_ENV = "CLOUD_RUN_TASK_INDEX"
 _CLOUD_RUN_TASK_COUNT_ENV = "CLOUD_RUN_TASK_COUNT"
+_CLOUD_RUN_EXECUTION_ENV = "CLOUD_RUN_EXECUTION"
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -118,6 +119,21 @@ def _resolve_cloud_run_task_metadata() -> tuple[int, int] | None:
     return task_index, task_count
 
 
+def _resolve_run_id(execution_id: str | None) -> str:
+    """Resolve run id.
+
+    All tasks of a Cloud Run Job execution share the execution name as their run id so rows
+    written by different shards join on a single `run_id`.
+
+    Args:
+        execution_id: The Cloud Run Job execution name, if any.
+
+    Returns:
+        The run id for this invocation.
+    """
+    return execution_id or secrets.token_hex(16)
+
+
 def _shard_service_checker_classes(
     service_checker_classes: Sequence[type[BaseServiceChecker]],
     *,
@@ -308,8 +324,8 @@ async def _run_once(*, targets: list[str], strict: bool, dry_run: bool) -> None:
         cloud_run_task_count=cloud_run_task_count,
     )
 
-    run_id = uuid4().hex
-    execution_id = os.getenv("CLOUD_RUN_EXECUTION")
+    execution_id = os.getenv(_CLOUD_RUN_EXECUTION_ENV)
+    run_id = _resolve_run_id(execution_id)
     ingested_at = datetime.now(UTC)
     service_count = 0
     check_count = 0
@@ -404,7 +420,7 @@ def main() -> None:
         get_settings.cache_clear()
         clear_proxy_resolution_cache()
 
-    asyncio.run(_run_once(targets=args.targets, strict=args.strict, dry_run=args.dry_run))
+    run_entrypoint(_run_once(targets=args.targets, strict=args.strict, dry_run=args.dry_run))
 
 
 if __name__ == "__main__":
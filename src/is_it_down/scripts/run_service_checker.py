@@ -1,13 +1,15 @@
 """Provide functionality for `is_it_down.scripts.run_service_checker`."""
 
 import argparse
-import asyncio
 import json
 import os
-from typing import Any
+import sys
+from collections.abc import Sequence
+from typing import Any, TextIO
 
 from is_it_down.checkers.base import BaseServiceChecker, ServiceRunResult
 from is_it_down.checkers.proxy import clear_proxy_resolution_cache
+from is_it_down.core.event_loop import run_entrypoint
 from is_it_down.scripts.checker_runtime import (
     discover_service_checkers,
     execute_service_checkers,
@@ -16,6 +18,27 @@ from is_it_down.scripts.checker_runtime import (
 )
 from is_it_down.settings import get_settings
 
+_HUMAN_ROW_TEMPLATE = "{:40.40} {:9} {:9} {:6} {}\n"
+_HUMAN_HEADER = _HUMAN_ROW_TEMPLATE.format("CHECK", "STATUS", "LATENCY", "HTTP", "ERROR")
+_HUMAN_HEADER_RULE = "-" * (len(_HUMAN_HEADER) - 1) + "\n"
+_HUMAN_DETAIL_PREFIX = _HUMAN_ROW_TEMPLATE.format("", "", "", "", "").rstrip("\n")
+
+
+def _dumps_json(value: Any, *, indent: bool = False) -> str:
+    """Serialize a value to sorted-key JSON with the stdlib encoder.
+
+    orjson is not used here because it writes raw non-ASCII, turns NaN and Infinity into `null`,
+    and rejects integers wider than 64 bits, all of which would change the CLI output.
+
+    Args:
+        value: The value to serialize.
+        indent: Whether to pretty-print with a two-space indent.
+
+    Returns:
+        The JSON document as a string.
+    """
+    return json.dumps(value, indent=2 if indent else None, sort_keys=True)
+
 
 def _check_result_payload(check_result: Any) -> dict[str, Any]:
     """Check result payload.
@@ -54,7 +77,7 @@ def _serialize_run(
     return {
         "service_key": run_result.service_key,
         "checker_class": service_checker_path(service_checker_cls),
-        "checks": [_check_result_payload(check_result) for check_result in run_result.check_results],
+        "checks": list(map(_check_result_payload, run_result.check_results)),
     }
 
 
@@ -65,20 +88,22 @@ def _print_human(
     verbose: bool,
 ) -> None:
     """Print human.
+
+    Lines for one service are collected and written to stdout in a single call.
     
     Args:
         service_checker_cls: The service checker cls value.
         run_result: The run result value.
         verbose: The verbose value.
     """
-    print(f"Service: {run_result.service_key} ({service_checker_path(service_checker_cls)})")
+    lines = [f"Service: {run_result.service_key} ({service_checker_path(service_checker_cls)})\n"]
     if not run_result.check_results:
-        print("  (no checks configured)\n")
+        lines.append("  (no checks configured)\n\n")
+        sys.stdout.write("".join(lines))
         return
 
-    header = f"{'CHECK':40} {'STATUS':9} {'LATENCY':9} {'HTTP':6} ERROR"
-    print(header)
-    print("-" * len(header))
+    lines.append(_HUMAN_HEADER)
+    lines.append(_HUMAN_HEADER_RULE)
     for check_result in run_result.check_results:
         latency = f"{check_result.latency_ms}ms" if check_result.latency_ms is not None else "-"
         http_status = str(check_result.http_status) if check_result.http_status is not None else "-"
@@ -89,19 +114,48 @@ def _print_human(
                 part for part in [check_result.error_code, check_result.error_message] if part is not None
             )
 
-        print(f"{check_result.check_key[:40]:40} {check_result.status:9} {latency:9} {http_status:6} {error}")
+        lines.append(
+            _HUMAN_ROW_TEMPLATE.format(check_result.check_key, check_result.status, latency, http_status, error)
+        )
 
         if check_result.metadata:
-            metadata = json.dumps(check_result.metadata, sort_keys=True)
-            print(f"{'':40} {'':9} {'':9} {'':6} metadata={metadata}")
+            lines.append(f"{_HUMAN_DETAIL_PREFIX}metadata={_dumps_json(check_result.metadata)}\n")
 
         if verbose and check_result.status != "up":
-            payload = json.dumps(_check_result_payload(check_result), indent=2, sort_keys=True)
-            print(f"{'':40} {'':9} {'':9} {'':6} verbose:")
-            for line in payload.splitlines():
-                print(f"{'':40} {'':9} {'':9} {'':6} {line}")
+            payload = _dumps_json(_check_result_payload(check_result), indent=True)
+            lines.append(f"{_HUMAN_DETAIL_PREFIX}verbose:\n")
+            lines.extend(f"{_HUMAN_DETAIL_PREFIX}{line}\n" for line in payload.splitlines())
 
-    print("")
+    lines.append("\n")
+    sys.stdout.write("".join(lines))
+
+
+def _write_json_runs(
+    runs: Sequence[tuple[type[BaseServiceChecker], ServiceRunResult]],
+    stream: TextIO,
+) -> None:
+    """Write runs as a JSON array, one run at a time.
+
+    The output matches a single two-space-indented dump of the full list, but only one run is
+    serialized in memory at a time and the stream is flushed after each run.
+
+    Args:
+        runs: The checker classes paired with their run results.
+        stream: The text stream to write to.
+    """
+    if not runs:
+        stream.write("[]\n")
+        return
+
+    stream.write("[\n")
+    for index, (service_checker_cls, run_result) in enumerate(runs):
+        if index:
+            stream.write(",\n")
+        payload = _dumps_json(_serialize_run(service_checker_cls, run_result), indent=True)
+        stream.write("  " + payload.replace("\n", "\n  "))
+        stream.flush()
+    stream.write("\n]\n")
+    stream.flush()
 
 
 def _has_non_up_result(run_result: ServiceRunResult) -> bool:
@@ -204,16 +258,10 @@ def main() -> None:
     except ValueError as exc:
         parser.error(str(exc))
 
-    runs = asyncio.run(execute_service_checkers(service_checker_classes))
+    runs = run_entrypoint(execute_service_checkers(service_checker_classes, concurrent=True))
 
     if args.json:
-        print(
-            json.dumps(
-                [_serialize_run(service_checker_cls, run_result) for service_checker_cls, run_result in runs],
-                indent=2,
-                sort_keys=True,
-            )
-        )
+        _write_json_runs(runs, sys.stdout)
     else:
         for service_checker_cls, run_result in runs:
             _print_human(service_checker_cls, run_result, verbose=args.verbose)
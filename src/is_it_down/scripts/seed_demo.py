@@ -1,10 +1,10 @@
 """Provide functionality for `is_it_down.scripts.seed_demo`."""
 
-import asyncio
 from datetime import UTC, datetime
 
 from sqlalchemy import select
 
+from is_it_down.core.event_loop import run_entrypoint
 from is_it_down.db.models import Service, ServiceCheck
 from is_it_down.db.session import get_sessionmaker
 
@@ -50,7 +50,7 @@ async def seed_cloudflare() -> None:
 
 def main() -> None:
     """Run the entrypoint."""
-    asyncio.run(seed_cloudflare())
+    run_entrypoint(seed_cloudflare())
 
 
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
 """Provide functionality for `is_it_down.settings`."""
 
+import os
 from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_ENV_FILE_ENV = "IS_IT_DOWN_ENV_FILE"
+
 
 class Settings(BaseSettings):
     """Represent `Settings`."""
@@ -15,6 +18,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     env: Literal["local", "development", "production"] = "local"
@@ -35,10 +39,14 @@ class Settings(BaseSettings):
     per_service_concurrency: int = 10
     worker_lease_seconds: int = 30
     worker_max_attempts: int = 3
+    worker_max_check_timeout_seconds: float = 8.0
     checker_concurrency: int = 10
     checker_max_response_body_bytes: int = 524288
     checker_max_json_response_body_bytes: int = 1048576
     checker_insert_batch_size: int = 500
+    checker_http_max_connections: int = 100
+    checker_http_max_keepalive_connections: int = 100
+    checker_http_keepalive_expiry_seconds: float = 30.0
 
     default_http_timeout_seconds: float = 5.0
     user_agent: str = "is-it-down/0.1.0"
@@ -66,8 +74,14 @@ class Settings(BaseSettings):
 @lru_cache
 def get_settings() -> Settings:
     """Get settings.
+
+    `IS_IT_DOWN_ENV_FILE` overrides the dotenv path; set it to an empty string to skip dotenv
+    parsing entirely (container images configure everything through the environment).
     
     Returns:
         The resulting value.
     """
-    return Settings()
+    env_file = os.environ.get(_ENV_FILE_ENV)
+    if env_file is None:
+        return Settings()
+    return Settings(_env_file=env_file or None)
@@ -1,12 +1,21 @@
 """Provide functionality for `is_it_down.worker.queue`."""
 
+import asyncio
 import random
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, bindparam, case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from is_it_down.db.models import CheckJob
+from is_it_down.db.models import CheckJob, ServiceCheck
+
+_MAX_RETRY_BACKOFF_SECONDS = 60
+_RETRY_BACKOFF_SECONDS = tuple(min(_MAX_RETRY_BACKOFF_SECONDS, 1 << exponent) for exponent in range(7))
+_RETRY_JITTER_SECONDS = 0.5
+_retry_jitter = random.Random()
+CHECK_JOBS_READY_CHANNEL = "check_jobs_ready"
 
 
 def retry_delay_seconds(attempt: int) -> float:
@@ -18,8 +27,12 @@ def retry_delay_seconds(attempt: int) -> float:
     Returns:
         The resulting value.
     """
-    capped = min(60, 2 ** max(0, attempt - 1))
-    return capped + random.uniform(0, 0.5)
+    exponent = max(0, attempt - 1)
+    if exponent < len(_RETRY_BACKOFF_SECONDS):
+        capped = _RETRY_BACKOFF_SECONDS[exponent]
+    else:
+        capped = _MAX_RETRY_BACKOFF_SECONDS
+    return capped + _retry_jitter.random() * _RETRY_JITTER_SECONDS
 
 
 async def claim_jobs(
@@ -31,6 +44,11 @@ async def claim_jobs(
     lease_seconds: int,
 ) -> list[CheckJob]:
     """Claim jobs.
+
+    The claim scan is served by the partial `ix_check_jobs_claimable_scheduled_for` index
+    (`scheduled_for WHERE status IN ('queued', 'leased')`), so each poll is a range scan bounded
+    by `batch_size` rather than a scan over finished jobs. Jobs whose check is disabled are marked
+    done in the same statement and are not returned.
     
     Args:
         session: The session value.
@@ -47,67 +65,137 @@ async def claim_jobs(
         and_(CheckJob.status == "leased", CheckJob.lease_expires_at.is_not(None), CheckJob.lease_expires_at < now),
     )
 
-    stmt = (
-        select(CheckJob)
+    # Lock only ids in a CTE and lease them in the same statement: one round-trip per claim.
+    locked = (
+        select(CheckJob.id, ServiceCheck.enabled)
+        .join(ServiceCheck, ServiceCheck.id == CheckJob.check_id)
         .where(claimable)
         .where(CheckJob.scheduled_for <= now)
         .order_by(CheckJob.scheduled_for.asc())
         .limit(batch_size)
-        .with_for_update(skip_locked=True)
+        .with_for_update(of=CheckJob, skip_locked=True)
+        .cte("locked")
     )
 
-    jobs = (await session.scalars(stmt)).all()
-    if not jobs:
-        return []
-
+    # Jobs for disabled checks are settled as done by the claim itself instead of being leased.
     lease_expires_at = now + timedelta(seconds=lease_seconds)
-    for job in jobs:
-        job.status = "leased"
-        job.worker_id = worker_id
-        job.lease_expires_at = lease_expires_at
-        job.attempt += 1
-
-    return jobs
+    lease_stmt = (
+        update(CheckJob)
+        .where(CheckJob.id == locked.c.id)
+        .values(
+            status=case((locked.c.enabled, "leased"), else_="done"),
+            worker_id=worker_id,
+            lease_expires_at=case((locked.c.enabled, lease_expires_at), else_=None),
+            attempt=CheckJob.attempt + 1,
+        )
+        .returning(CheckJob)
+        .execution_options(populate_existing=True, synchronize_session=False)
+    )
+    jobs = [job for job in (await session.scalars(lease_stmt)).all() if job.status == "leased"]
+    # RETURNING order is unspecified; keep the oldest-first claim order.
+    return sorted(jobs, key=lambda job: job.scheduled_for)
 
 
-async def mark_job_done(session: AsyncSession, job_id: int) -> None:
-    """Mark job done.
+async def mark_jobs_done(session: AsyncSession, job_ids: Sequence[int]) -> None:
+    """Mark jobs done.
     
     Args:
         session: The session value.
-        job_id: The job id value.
+        job_ids: The job ids value.
     """
-    job = await session.get(CheckJob, job_id)
-    if job is None:
+    if not job_ids:
         return
 
-    job.status = "done"
-    job.lease_expires_at = None
+    await session.execute(
+        update(CheckJob)
+        .where(CheckJob.id.in_(job_ids))
+        .values(status="done", lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
 
 
-async def mark_job_retry_or_fail(
+async def mark_jobs_retry_or_fail(
     session: AsyncSession,
+    jobs: Sequence[tuple[int, int]],
     *,
-    job_id: int,
     now: datetime,
 ) -> None:
-    """Mark job retry or fail.
+    """Mark jobs retry or fail.
+
+    The retry-vs-fail decision is made server-side against each row's `max_attempts`, and all jobs
+    are updated by one executemany statement without loading them first.
     
     Args:
         session: The session value.
-        job_id: The job id value.
+        jobs: The job ids paired with the attempt number each job was leased with.
         now: The now value.
     """
-    job = await session.get(CheckJob, job_id)
-    if job is None:
+    if not jobs:
         return
 
-    if job.attempt >= job.max_attempts:
-        job.status = "failed"
-        job.lease_expires_at = None
-        return
+    exhausted = CheckJob.attempt >= CheckJob.max_attempts
+    retry_scheduled_for = bindparam("retry_scheduled_for", type_=CheckJob.scheduled_for.type)
+    stmt = (
+        update(CheckJob.__table__)
+        .where(CheckJob.id == bindparam("job_id"))
+        .values(
+            status=case((exhausted, "failed"), else_="queued"),
+            worker_id=case((exhausted, CheckJob.worker_id), else_=None),
+            lease_expires_at=None,
+            scheduled_for=case((exhausted, CheckJob.scheduled_for), else_=retry_scheduled_for),
+        )
+    )
+    connection = await session.connection()
+    await connection.execute(
+        stmt,
+        [
+            {
+                "job_id": job_id,
+                "retry_scheduled_for": now + timedelta(seconds=retry_delay_seconds(attempt)),
+            }
+            for job_id, attempt in jobs
+        ],
+    )
+
+
+async def notify_jobs_ready(session: AsyncSession) -> None:
+    """Notify listening workers that new jobs were queued.
+
+    The notification is transactional and is only delivered once the session commits.
+
+    Args:
+        session: The session value.
+    """
+    await session.execute(select(func.pg_notify(CHECK_JOBS_READY_CHANNEL, "")))
+
+
+@asynccontextmanager
+async def listen_for_ready_jobs(engine: AsyncEngine, jobs_ready: asyncio.Event) -> AsyncIterator[None]:
+    """Set `jobs_ready` whenever a job-ready notification arrives.
+
+    Holds one dedicated connection for the lifetime of the context.
+
+    Args:
+        engine: The engine value.
+        jobs_ready: The event to set on each notification.
+
+    Yields:
+        Control while the listener is registered.
+    """
 
-    job.status = "queued"
-    job.worker_id = None
-    job.lease_expires_at = None
-    job.scheduled_for = now + timedelta(seconds=retry_delay_seconds(job.attempt))
+    def _on_notification(*_: object) -> None:
+        """On notification.
+
+        Args:
+            *_: The asyncpg listener callback arguments.
+        """
+        jobs_ready.set()
+
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        await driver_connection.add_listener(CHECK_JOBS_READY_CHANNEL, _on_notification)
+        try:
+            yield
+        finally:
+            await driver_connection.remove_listener(CHECK_JOBS_READY_CHANNEL, _on_notification)
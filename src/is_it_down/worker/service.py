@@ -2,16 +2,23 @@
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
 from datetime import UTC, datetime
+from functools import lru_cache
 from socket import gethostname
+from typing import Any, Final, Literal
 from uuid import uuid4
 
 import httpx
 import structlog
 from pydantic import BaseModel
-from sqlalchemy import and_, func, select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import Integer, bindparam, func, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from is_it_down.checkers.base import BaseCheck
 from is_it_down.checkers.registry import registry
 from is_it_down.core.attribution import attribute_dependency
 from is_it_down.core.models import CheckResult, DependencySignal
@@ -20,16 +27,20 @@ from is_it_down.db.models import (
     CheckRun,
     Incident,
     IncidentEvent,
+    LatestCheckRun,
     ServiceCheck,
     ServiceDependency,
     ServiceSnapshot,
 )
-from is_it_down.db.session import get_sessionmaker
+from is_it_down.db.session import get_engine, get_sessionmaker
 from is_it_down.logging import configure_logging
 from is_it_down.settings import get_settings
-from is_it_down.worker.queue import claim_jobs, mark_job_done, mark_job_retry_or_fail
+from is_it_down.worker.queue import claim_jobs, listen_for_ready_jobs, mark_jobs_done, mark_jobs_retry_or_fail
 
 logger = structlog.get_logger(__name__)
+JobOutcome = Literal["done", "retry"]
+_SEVERITY_RANK: Final[dict[str, int]] = {"up": 0, "degraded": 1, "down": 2}
+_STREAM_PARTITION_ROWS: Final[int] = 500
 
 
 class ClaimedJob(BaseModel):
@@ -38,149 +49,172 @@ class ClaimedJob(BaseModel):
     id: int
     service_id: int
     check_id: int
+    attempt: int
+
+
+# Worker statements are built once at import; per-call values are bound at execution.
+_SERVICE_IDS = bindparam("service_ids", expanding=True)
+
+_LATEST_CHECK_RESULTS_STMT = (
+    select(
+        ServiceCheck.service_id,
+        ServiceCheck.check_key,
+        ServiceCheck.weight,
+        LatestCheckRun.status,
+        LatestCheckRun.observed_at,
+        LatestCheckRun.latency_ms,
+        LatestCheckRun.http_status,
+        LatestCheckRun.error_code,
+        LatestCheckRun.error_message,
+        LatestCheckRun.metadata_json,
+    )
+    .outerjoin(LatestCheckRun, LatestCheckRun.check_id == ServiceCheck.id)
+    .where(ServiceCheck.service_id.in_(_SERVICE_IDS))
+    .where(ServiceCheck.enabled.is_(True))
+)
 
+_dependency_ids = select(ServiceDependency.depends_on_service_id).where(
+    ServiceDependency.service_id.in_(_SERVICE_IDS)
+)
+# Both keys descend so Postgres can walk ix_service_snapshots_service_observed backwards.
+_latest_snapshots = (
+    select(
+        ServiceSnapshot.service_id.label("service_id"),
+        ServiceSnapshot.status.label("status"),
+    )
+    .where(ServiceSnapshot.service_id.in_(_dependency_ids))
+    .order_by(ServiceSnapshot.service_id.desc(), ServiceSnapshot.observed_at.desc())
+    .distinct(ServiceSnapshot.service_id)
+    .subquery()
+)
 
-def _severity_rank(status: str) -> int:
-    """Severity rank.
-    
-    Args:
-        status: The status value.
-    
-    Returns:
-        The resulting value.
-    """
-    mapping = {"up": 0, "degraded": 1, "down": 2}
-    return mapping.get(status, 0)
+_DEPENDENCY_SIGNALS_STMT = (
+    select(
+        ServiceDependency.service_id,
+        ServiceDependency.depends_on_service_id,
+        ServiceDependency.dependency_type,
+        ServiceDependency.weight,
+        _latest_snapshots.c.status,
+    )
+    .outerjoin(
+        _latest_snapshots,
+        _latest_snapshots.c.service_id == ServiceDependency.depends_on_service_id,
+    )
+    .where(ServiceDependency.service_id.in_(_SERVICE_IDS))
+)
+
+_LATEST_CHECK_RUN_COLUMNS = tuple(column.key for column in LatestCheckRun.__table__.columns)
+_latest_check_run_insert = pg_insert(LatestCheckRun)
+_UPSERT_LATEST_CHECK_RUN_STMT = _latest_check_run_insert.on_conflict_do_update(
+    index_elements=[LatestCheckRun.check_id],
+    set_={key: _latest_check_run_insert.excluded[key] for key in _LATEST_CHECK_RUN_COLUMNS if key != "check_id"},
+    where=LatestCheckRun.observed_at < _latest_check_run_insert.excluded.observed_at,
+)
+
+# Two-key advisory locks keep service ids from colliding with other advisory lock users.
+_SERVICE_SNAPSHOT_LOCK_CLASS = 1001
+_locked_service_id = func.unnest(bindparam("service_ids", type_=ARRAY(Integer))).column_valued("service_id")
+# unnest yields the ids in array order, so the locks are taken in the order the caller sorted them.
+_LOCK_SERVICE_SNAPSHOTS_STMT = select(func.pg_advisory_xact_lock(_SERVICE_SNAPSHOT_LOCK_CLASS, _locked_service_id))
+
+_OPEN_INCIDENT_STMT = (
+    select(Incident)
+    .where(Incident.service_id == bindparam("service_id"))
+    .where(Incident.status == "open")
+    .order_by(Incident.started_at.desc())
+    .limit(1)
+)
 
 
-async def _latest_service_check_results(
+async def _latest_service_check_results_bulk(
     session: AsyncSession,
-    service_id: int,
-) -> tuple[list[CheckResult], dict[str, float]]:
-    """Latest service check results.
+    service_ids: Sequence[int],
+) -> dict[int, tuple[list[CheckResult], dict[str, float]]]:
+    """Latest service check results for several services in one query.
     
     Args:
         session: The session value.
-        service_id: The service id value.
+        service_ids: The service ids value.
     
     Returns:
-        The resulting value.
+        The latest check results and check weights keyed by service id.
     """
-    latest_runs = (
-        select(
-            CheckRun.check_id.label("check_id"),
-            CheckRun.status.label("status"),
-            CheckRun.observed_at.label("observed_at"),
-            CheckRun.latency_ms.label("latency_ms"),
-            CheckRun.http_status.label("http_status"),
-            CheckRun.error_code.label("error_code"),
-            CheckRun.error_message.label("error_message"),
-            CheckRun.metadata_json.label("metadata_json"),
-            func.row_number()
-            .over(partition_by=CheckRun.check_id, order_by=CheckRun.observed_at.desc())
-            .label("row_num"),
-        )
-        .where(CheckRun.service_id == service_id)
-        .subquery()
-    )
-
-    stmt = (
-        select(
-            ServiceCheck.check_key,
-            ServiceCheck.weight,
-            latest_runs.c.status,
-            latest_runs.c.observed_at,
-            latest_runs.c.latency_ms,
-            latest_runs.c.http_status,
-            latest_runs.c.error_code,
-            latest_runs.c.error_message,
-            latest_runs.c.metadata_json,
-        )
-        .outerjoin(
-            latest_runs,
-            and_(latest_runs.c.check_id == ServiceCheck.id, latest_runs.c.row_num == 1),
-        )
-        .where(ServiceCheck.service_id == service_id)
-        .where(ServiceCheck.enabled.is_(True))
-    )
-
-    rows = (await session.execute(stmt)).all()
-
-    results: list[CheckResult] = []
-    weights_by_check: dict[str, float] = {}
-    for row in rows:
-        check_key = row.check_key
-        weights_by_check[check_key] = row.weight
-
-        if row.status is None or row.observed_at is None:
-            continue
-
-        results.append(
-            CheckResult(
-                check_key=check_key,
-                status=row.status,
-                observed_at=row.observed_at,
-                latency_ms=row.latency_ms,
-                http_status=row.http_status,
-                error_code=row.error_code,
-                error_message=row.error_message,
-                metadata=row.metadata_json or {},
+    if not service_ids:
+        return {}
+
+    rows = await session.stream(_LATEST_CHECK_RESULTS_STMT, {"service_ids": list(service_ids)})
+
+    results_by_service: dict[int, tuple[list[CheckResult], dict[str, float]]] = {
+        service_id: ([], {}) for service_id in service_ids
+    }
+    # Rows come from typed columns the worker itself wrote, so models are built without validation.
+    async for partition in rows.tuples().partitions(_STREAM_PARTITION_ROWS):
+        for (
+            service_id,
+            check_key,
+            weight,
+            status,
+            observed_at,
+            latency_ms,
+            http_status,
+            error_code,
+            error_message,
+            metadata_json,
+        ) in partition:
+            results, weights_by_check = results_by_service[service_id]
+            weights_by_check[check_key] = weight
+
+            if status is None or observed_at is None:
+                continue
+
+            results.append(
+                CheckResult.model_construct(
+                    check_key=check_key,
+                    status=status,
+                    observed_at=observed_at,
+                    latency_ms=latency_ms,
+                    http_status=http_status,
+                    error_code=error_code,
+                    error_message=error_message,
+                    metadata=metadata_json or {},
+                )
             )
-        )
 
-    return results, weights_by_check
+    return results_by_service
 
 
-async def _dependency_signals(session: AsyncSession, service_id: int) -> list[DependencySignal]:
-    """Dependency signals.
+async def _dependency_signals_bulk(
+    session: AsyncSession,
+    service_ids: Sequence[int],
+) -> dict[int, list[DependencySignal]]:
+    """Dependency signals for several services in one query.
     
     Args:
         session: The session value.
-        service_id: The service id value.
+        service_ids: The service ids value.
     
     Returns:
-        The resulting value.
+        The dependency signals keyed by service id.
     """
-    latest_snapshots = select(
-        ServiceSnapshot.service_id.label("service_id"),
-        ServiceSnapshot.status.label("status"),
-        func.row_number()
-        .over(partition_by=ServiceSnapshot.service_id, order_by=ServiceSnapshot.observed_at.desc())
-        .label("row_num"),
-    ).subquery()
-
-    stmt = (
-        select(
-            ServiceDependency.depends_on_service_id,
-            ServiceDependency.dependency_type,
-            ServiceDependency.weight,
-            latest_snapshots.c.status,
-        )
-        .outerjoin(
-            latest_snapshots,
-            and_(
-                latest_snapshots.c.service_id == ServiceDependency.depends_on_service_id,
-                latest_snapshots.c.row_num == 1,
-            ),
-        )
-        .where(ServiceDependency.service_id == service_id)
-    )
-
-    rows = (await session.execute(stmt)).all()
-    signals: list[DependencySignal] = []
-    for row in rows:
-        if row.status is None:
-            continue
-        signals.append(
-            DependencySignal(
-                dependency_service_id=row.depends_on_service_id,
-                dependency_status=row.status,
-                dependency_type=row.dependency_type,
-                weight=row.weight,
+    if not service_ids:
+        return {}
+
+    rows = await session.stream(_DEPENDENCY_SIGNALS_STMT, {"service_ids": list(service_ids)})
+    signals_by_service: dict[int, list[DependencySignal]] = {service_id: [] for service_id in service_ids}
+    async for partition in rows.tuples().partitions(_STREAM_PARTITION_ROWS):
+        for service_id, depends_on_service_id, dependency_type, weight, status in partition:
+            if status is None:
+                continue
+            signals_by_service[service_id].append(
+                DependencySignal.model_construct(
+                    dependency_service_id=depends_on_service_id,
+                    dependency_status=status,
+                    dependency_type=dependency_type,
+                    weight=weight,
+                )
             )
-        )
 
-    return signals
+    return signals_by_service
 
 
 async def _sync_incident_state(
@@ -202,14 +236,7 @@ async def _sync_incident_state(
         probable_root_service_id: The probable root service id value.
         confidence: The confidence value.
     """
-    open_incident_stmt = (
-        select(Incident)
-        .where(Incident.service_id == service_id)
-        .where(Incident.status == "open")
-        .order_by(Incident.started_at.desc())
-        .limit(1)
-    )
-    open_incident = await session.scalar(open_incident_stmt)
+    open_incident = await session.scalar(_OPEN_INCIDENT_STMT, {"service_id": service_id})
 
     if status == "up":
         if open_incident is None:
@@ -247,7 +274,7 @@ async def _sync_incident_state(
         )
         return
 
-    if _severity_rank(status) > _severity_rank(open_incident.peak_severity):
+    if _SEVERITY_RANK.get(status, 0) > _SEVERITY_RANK.get(open_incident.peak_severity, 0):
         open_incident.peak_severity = status
 
     open_incident.probable_root_service_id = probable_root_service_id
@@ -267,20 +294,29 @@ async def _recompute_service_snapshot(
     *,
     service_id: int,
     observed_at: datetime,
-) -> None:
-    """Recompute service snapshot.
+    check_results: list[CheckResult],
+    weights_by_check: dict[str, float],
+    dependency_signals: list[DependencySignal],
+) -> dict[str, Any]:
+    """Recompute service snapshot and sync incident state.
+    
+    The snapshot row is returned rather than added to the session so callers can insert a batch
+    of snapshots in one statement.
     
     Args:
         session: The session value.
         service_id: The service id value.
         observed_at: The observed at value.
+        check_results: The latest check results for the service.
+        weights_by_check: The check weights for the service.
+        dependency_signals: The dependency signals for the service.
+    
+    Returns:
+        The `ServiceSnapshot` column values.
     """
-    check_results, weights_by_check = await _latest_service_check_results(session, service_id)
-
     raw_score = weighted_service_score(check_results, weights_by_check)
     status = status_from_score(raw_score)
 
-    dependency_signals = await _dependency_signals(session, service_id)
     attribution = attribute_dependency(status, dependency_signals)
 
     effective_score = raw_score
@@ -290,18 +326,6 @@ async def _recompute_service_snapshot(
             raw_score + (100.0 - raw_score) * (0.15 + 0.35 * attribution.attribution_confidence),
         )
 
-    snapshot = ServiceSnapshot(
-        service_id=service_id,
-        observed_at=observed_at,
-        raw_score=raw_score,
-        effective_score=round(effective_score, 2),
-        status=status,
-        dependency_impacted=attribution.dependency_impacted,
-        attribution_confidence=attribution.attribution_confidence,
-        probable_root_service_id=attribution.probable_root_service_id,
-    )
-    session.add(snapshot)
-
     await _sync_incident_state(
         session,
         service_id=service_id,
@@ -311,73 +335,75 @@ async def _recompute_service_snapshot(
         confidence=attribution.attribution_confidence,
     )
 
+    return {
+        "service_id": service_id,
+        "observed_at": observed_at,
+        "raw_score": raw_score,
+        "effective_score": round(effective_score, 2),
+        "status": status,
+        "dependency_impacted": attribution.dependency_impacted,
+        "attribution_confidence": attribution.attribution_confidence,
+        "probable_root_service_id": attribution.probable_root_service_id,
+    }
+
 
-async def _process_claimed_job(
+@lru_cache(maxsize=1024)
+def _checker_for(class_path: str, timeout_seconds: float, weight: float) -> BaseCheck:
+    """Checker for a service check configuration.
+
+    Checks keep no per-run state and take the HTTP client as an argument, so one instance per
+    configuration is reused by every job, including concurrent ones.
+
+    Args:
+        class_path: The check class path.
+        timeout_seconds: The timeout seconds value.
+        weight: The weight value.
+
+    Returns:
+        The resulting value.
+    """
+    checker = registry.get(class_path)()
+    checker.timeout_seconds = timeout_seconds
+    checker.weight = weight
+    return checker
+
+
+async def _run_claimed_job(
     claimed_job: ClaimedJob,
+    check: ServiceCheck | None,
     *,
-    session_factory: async_sessionmaker[AsyncSession],
     client: httpx.AsyncClient,
     per_service_semaphores: dict[int, asyncio.Semaphore],
     global_semaphore: asyncio.Semaphore,
-) -> None:
-    """Process claimed job.
+) -> CheckResult | JobOutcome:
+    """Run the check for a claimed job without persisting anything.
     
     Args:
         claimed_job: The claimed job value.
-        session_factory: The session factory value.
+        check: The job's prefetched service check, or None when it no longer exists.
         client: The client value.
         per_service_semaphores: The per service semaphores value.
         global_semaphore: The global semaphore value.
+    
+    Returns:
+        The check result to record, "done" when the check is missing or disabled, or "retry" when
+        the check failed.
     """
     service_semaphore = per_service_semaphores[claimed_job.service_id]
 
     async with global_semaphore, service_semaphore:
         try:
-            async with session_factory() as session:
-                check = await session.get(ServiceCheck, claimed_job.check_id)
-                if check is None or not check.enabled:
-                    await mark_job_done(session, claimed_job.id)
-                    await session.commit()
-                    return
-
-                check_cls = registry.get(check.class_path)
-                checker = check_cls()
-                checker.timeout_seconds = check.timeout_seconds
-                checker.weight = check.weight
-
-                result = await checker.execute(client)
-
-                session.add(
-                    CheckRun(
-                        job_id=claimed_job.id,
-                        service_id=claimed_job.service_id,
-                        check_id=claimed_job.check_id,
-                        status=result.status,
-                        latency_ms=result.latency_ms,
-                        http_status=result.http_status,
-                        error_code=result.error_code,
-                        error_message=result.error_message,
-                        metadata_json=result.metadata,
-                        observed_at=result.observed_at,
-                    )
-                )
-
-                await _recompute_service_snapshot(
-                    session,
-                    service_id=claimed_job.service_id,
-                    observed_at=result.observed_at,
-                )
-
-                await mark_job_done(session, claimed_job.id)
-                await session.commit()
-
-                logger.info(
-                    "worker.job_processed",
-                    job_id=claimed_job.id,
-                    service_id=claimed_job.service_id,
-                    check_id=claimed_job.check_id,
-                    result_status=result.status,
-                )
+            if check is None or not check.enabled:
+                return "done"
+
+            timeout_seconds = min(check.timeout_seconds, get_settings().worker_max_check_timeout_seconds)
+            checker = _checker_for(check.class_path, timeout_seconds, check.weight)
+            observed_at = datetime.now(UTC)
+            try:
+                # Hard ceiling: the check's own timeout only covers run(), not proxy setup.
+                return await asyncio.wait_for(checker.execute(client), timeout=timeout_seconds)
+            except TimeoutError:
+                return checker.timeout_result(observed_at)
         except Exception:
             logger.exception(
                 "worker.job_failed",
@@ -385,13 +411,179 @@ async def _process_claimed_job(
                 service_id=claimed_job.service_id,
                 check_id=claimed_job.check_id,
             )
-            async with session_factory() as retry_session:
-                await mark_job_retry_or_fail(
-                    retry_session,
-                    job_id=claimed_job.id,
-                    now=datetime.now(UTC),
-                )
-                await retry_session.commit()
+            return "retry"
+
+
+async def _lock_service_snapshots(session: AsyncSession, service_ids: Sequence[int]) -> None:
+    """Take transaction-scoped snapshot locks for the given services, waiting for other workers.
+
+    A worker that waits recomputes after the holder commits, so its snapshot sees both batches'
+    check runs. Locks are taken in sorted order so overlapping batches cannot deadlock.
+
+    Args:
+        session: The session value.
+        service_ids: The service ids value.
+    """
+    if not service_ids:
+        return
+
+    await session.execute(_LOCK_SERVICE_SNAPSHOTS_STMT, {"service_ids": sorted(service_ids)})
+
+
+async def _insert_check_runs_and_read_latest(
+    session: AsyncSession,
+    completed: Sequence[tuple[ClaimedJob, CheckResult]],
+    service_ids: Sequence[int],
+) -> dict[int, tuple[list[CheckResult], dict[str, float]]]:
+    """Insert a batch's check runs and read back the latest results for the affected services.
+
+    Each check's `LatestCheckRun` row is upserted alongside, and only moves forward in time.
+    
+    Args:
+        session: The session value.
+        completed: The claimed jobs paired with their check results.
+        service_ids: The service ids value.
+    
+    Returns:
+        The latest check results and check weights keyed by service id.
+    """
+    runs = [
+        {
+            "job_id": claimed_job.id,
+            "service_id": claimed_job.service_id,
+            "check_id": claimed_job.check_id,
+            "status": result.status,
+            "latency_ms": result.latency_ms,
+            "http_status": result.http_status,
+            "error_code": result.error_code,
+            "error_message": result.error_message,
+            "metadata_json": result.metadata,
+            "observed_at": result.observed_at,
+        }
+        for claimed_job, result in completed
+    ]
+    await session.execute(insert(CheckRun), runs)
+
+    # One row per check: ON CONFLICT cannot update the same row twice in a statement.
+    latest_by_check: dict[int, dict[str, Any]] = {}
+    for run in runs:
+        latest = latest_by_check.get(run["check_id"])
+        if latest is None or run["observed_at"] > latest["observed_at"]:
+            latest_by_check[run["check_id"]] = run
+    await session.execute(
+        _UPSERT_LATEST_CHECK_RUN_STMT,
+        [{key: run[key] for key in _LATEST_CHECK_RUN_COLUMNS} for run in latest_by_check.values()],
+    )
+
+    return await _latest_service_check_results_bulk(session, service_ids)
+
+
+async def _read_dependency_signals(
+    session_factory: async_sessionmaker[AsyncSession],
+    service_ids: Sequence[int],
+) -> dict[int, list[DependencySignal]]:
+    """Read dependency signals on a dedicated session.
+    
+    Args:
+        session_factory: The session factory value.
+        service_ids: The service ids value.
+    
+    Returns:
+        The dependency signals keyed by service id.
+    """
+    if not service_ids:
+        return {}
+
+    async with session_factory() as session:
+        return await _dependency_signals_bulk(session, service_ids)
+
+
+async def _record_check_results(
+    session: AsyncSession,
+    completed: Sequence[tuple[ClaimedJob, CheckResult]],
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Record a batch of check results and refresh the affected service snapshots.
+    
+    The jobs are marked done in the same transaction. Check runs and snapshots are each written
+    with one multi-row insert, and one snapshot is written per affected service. A service whose
+    snapshot lock is held by another worker is waited on, then recomputed with both batches visible.
+
+    Latest check results must be read on the write session to see the runs just inserted.
+    Dependency signals only read committed snapshots, so they are fetched concurrently on a
+    separate session.
+    
+    Args:
+        session: The session value.
+        completed: The claimed jobs paired with their check results.
+        session_factory: The session factory value.
+    """
+    observed_at_by_service: dict[int, datetime] = {}
+    for claimed_job, result in completed:
+        observed_at = observed_at_by_service.get(claimed_job.service_id)
+        if observed_at is None or result.observed_at > observed_at:
+            observed_at_by_service[claimed_job.service_id] = result.observed_at
+
+    # Sorted so concurrent workers touch incident rows in the same order.
+    service_ids = sorted(observed_at_by_service)
+    await _lock_service_snapshots(session, service_ids)
+    async with asyncio.TaskGroup() as task_group:
+        latest_task = task_group.create_task(_insert_check_runs_and_read_latest(session, completed, service_ids))
+        signals_task = task_group.create_task(_read_dependency_signals(session_factory, service_ids))
+    latest_by_service = latest_task.result()
+    signals_by_service = signals_task.result()
+
+    snapshots: list[dict[str, Any]] = []
+    for service_id in service_ids:
+        check_results, weights_by_check = latest_by_service[service_id]
+        snapshots.append(
+            await _recompute_service_snapshot(
+                session,
+                service_id=service_id,
+                observed_at=observed_at_by_service[service_id],
+                check_results=check_results,
+                weights_by_check=weights_by_check,
+                dependency_signals=signals_by_service[service_id],
+            )
+        )
+    if snapshots:
+        await session.execute(insert(ServiceSnapshot), snapshots)
+
+    await mark_jobs_done(session, [claimed_job.id for claimed_job, _ in completed])
+
+
+@lru_cache(maxsize=1)
+def get_worker_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by worker batches.
+
+    The client and its keep-alive pool live until `close_worker_http_client` is called, so
+    connections to checked hosts are reused from one batch to the next.
+
+    Returns:
+        The resulting value.
+    """
+    settings = get_settings()
+    pool_size = settings.worker_concurrency * 2
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.default_http_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=settings.checker_http_keepalive_expiry_seconds,
+        ),
+        headers={"User-Agent": settings.user_agent},
+        follow_redirects=True,
+    )
+
+
+async def close_worker_http_client() -> None:
+    """Close the shared worker HTTP client, if one was created."""
+    if get_worker_http_client.cache_info().currsize == 0:
+        return
+    client = get_worker_http_client()
+    get_worker_http_client.cache_clear()
+    await client.aclose()
 
 
 def _default_worker_id() -> str:
@@ -440,53 +632,98 @@ async def run_worker_batch(
     if global_semaphore is None:
         global_semaphore = asyncio.Semaphore(settings.worker_concurrency)
     if per_service_semaphores is None:
+        # Batches never overlap, so per-service limits only need to live as long as one batch.
         per_service_semaphores = defaultdict(lambda: asyncio.Semaphore(settings.per_service_concurrency))
 
-    own_client = client is None
     if client is None:
-        timeout = httpx.Timeout(settings.default_http_timeout_seconds)
-        headers = {"User-Agent": settings.user_agent}
-        client = httpx.AsyncClient(timeout=timeout, headers=headers, follow_redirects=True)
-
-    try:
-        now = datetime.now(UTC)
-        async with session_factory() as session:
-            leased = await claim_jobs(
-                session,
-                now=now,
-                worker_id=worker_id,
-                batch_size=batch_size,
-                lease_seconds=lease_seconds,
-            )
-            claimed_jobs = [ClaimedJob(id=job.id, service_id=job.service_id, check_id=job.check_id) for job in leased]
-            await session.commit()
+        client = get_worker_http_client()
+
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        leased = await claim_jobs(
+            session,
+            now=now,
+            worker_id=worker_id,
+            batch_size=batch_size,
+            lease_seconds=lease_seconds,
+        )
+        claimed_jobs = [
+            ClaimedJob(id=job.id, service_id=job.service_id, check_id=job.check_id, attempt=job.attempt)
+            for job in leased
+        ]
+        await session.commit()
 
         if not claimed_jobs:
             return 0
 
-        await asyncio.gather(
-            *[
-                _process_claimed_job(
+        check_ids = {claimed_job.check_id for claimed_job in claimed_jobs}
+        checks_by_id = {
+            check.id: check
+            for check in await session.scalars(select(ServiceCheck).where(ServiceCheck.id.in_(check_ids)))
+        }
+
+    # _run_claimed_job turns check failures into "retry", so only cancellation tears the group down.
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(
+                _run_claimed_job(
                     claimed_job,
-                    session_factory=session_factory,
+                    checks_by_id.get(claimed_job.check_id),
                     client=client,
                     per_service_semaphores=per_service_semaphores,
                     global_semaphore=global_semaphore,
                 )
-                for claimed_job in claimed_jobs
-            ]
-        )
-        return len(claimed_jobs)
-    finally:
-        if own_client:
-            await client.aclose()
+            )
+            for claimed_job in claimed_jobs
+        ]
+    outcomes = [task.result() for task in tasks]
+
+    completed: list[tuple[ClaimedJob, CheckResult]] = []
+    skipped_job_ids: list[int] = []
+    failed_jobs: list[tuple[int, int]] = []
+    for claimed_job, outcome in zip(claimed_jobs, outcomes, strict=True):
+        if outcome == "done":
+            skipped_job_ids.append(claimed_job.id)
+        elif outcome == "retry":
+            failed_jobs.append((claimed_job.id, claimed_job.attempt))
+        else:
+            completed.append((claimed_job, outcome))
+
+    try:
+        async with session_factory() as session:
+            if completed:
+                await _record_check_results(session, completed, session_factory=session_factory)
+            await mark_jobs_done(session, skipped_job_ids)
+            await mark_jobs_retry_or_fail(session, failed_jobs, now=datetime.now(UTC))
+            await session.commit()
+    except Exception:
+        logger.exception("worker.batch_record_failed", job_count=len(completed))
+        failed_jobs.extend((claimed_job.id, claimed_job.attempt) for claimed_job, _ in completed)
+        async with session_factory() as session:
+            await mark_jobs_done(session, skipped_job_ids)
+            await mark_jobs_retry_or_fail(session, failed_jobs, now=datetime.now(UTC))
+            await session.commit()
+    else:
+        for claimed_job, result in completed:
+            logger.info(
+                "worker.job_processed",
+                job_id=claimed_job.id,
+                service_id=claimed_job.service_id,
+                check_id=claimed_job.check_id,
+                result_status=result.status,
+            )
+    return len(claimed_jobs)
 
 
-async def run_worker_loop(session_factory: async_sessionmaker[AsyncSession] | None = None) -> None:
+async def run_worker_loop(
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+    engine: AsyncEngine | None = None,
+) -> None:
     """Run worker loop.
     
     Args:
         session_factory: The session factory value.
+        engine: The engine to listen on for job notifications; defaults to the shared engine.
     """
     settings = get_settings()
     configure_logging(settings.log_level)
@@ -501,16 +738,21 @@ async def run_worker_loop(session_factory: async_sessionmaker[AsyncSession] | No
 
     if session_factory is None:
         session_factory = get_sessionmaker()
+    if engine is None:
+        engine = get_engine()
 
     global_semaphore = asyncio.Semaphore(settings.worker_concurrency)
-    per_service_semaphores: dict[int, asyncio.Semaphore] = defaultdict(
-        lambda: asyncio.Semaphore(settings.per_service_concurrency)
-    )
 
-    timeout = httpx.Timeout(settings.default_http_timeout_seconds)
-    headers = {"User-Agent": settings.user_agent}
+    jobs_ready = asyncio.Event()
+
+    async with AsyncExitStack() as stack:
+        client = get_worker_http_client()
+        stack.push_async_callback(close_worker_http_client)
+        try:
+            await stack.enter_async_context(listen_for_ready_jobs(engine, jobs_ready))
+        except Exception:
+            logger.warning("worker.job_notifications_unavailable", exc_info=True)
 
-    async with httpx.AsyncClient(timeout=timeout, headers=headers, follow_redirects=True) as client:
         while True:
             processed_count = await run_worker_batch(
                 session_factory=session_factory,
@@ -518,9 +760,13 @@ async def run_worker_loop(session_factory: async_sessionmaker[AsyncSession] | No
                 client=client,
                 batch_size=settings.worker_batch_size,
                 lease_seconds=settings.worker_lease_seconds,
-                per_service_semaphores=per_service_semaphores,
                 global_semaphore=global_semaphore,
             )
 
             if processed_count == 0:
-                await asyncio.sleep(settings.worker_poll_seconds)
+                # Wake on the scheduler's notification; polling remains the fallback for missed ones.
+                try:
+                    await asyncio.wait_for(jobs_ready.wait(), timeout=settings.worker_poll_seconds)
+                except TimeoutError:
+                    pass
+                jobs_ready.clear()
@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator, Mapping
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from is_it_down.checkers.base import BaseCheck, BaseServiceChecker
+from is_it_down.scripts.checker_runtime import discover_service_checkers
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def discovered_checkers() -> Mapping[str, type[BaseServiceChecker]]:
+    return discover_service_checkers()
+
+
+@pytest.fixture(scope="session")
+def discovered_checker_instances(
+    discovered_checkers: Mapping[str, type[BaseServiceChecker]],
+) -> dict[str, BaseServiceChecker]:
+    return {service_key: checker_cls() for service_key, checker_cls in discovered_checkers.items()}
+
+
+@pytest.fixture(scope="session")
+def checker_instances_with_checks(
+    discovered_checker_instances: Mapping[str, BaseServiceChecker],
+) -> dict[str, tuple[BaseServiceChecker, tuple[BaseCheck, ...]]]:
+    return {
+        service_key: (checker, tuple(checker.build_checks()))
+        for service_key, checker in discovered_checker_instances.items()
+    }
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    # One test item per service checker lets pytest-xdist spread the contract checks across workers.
+    if "checker_cls" in metafunc.fixturenames:
+        discovered = discover_service_checkers()
+        metafunc.parametrize("checker_cls", list(discovered.values()), ids=list(discovered))
@@ -44,7 +44,6 @@ def _reset_settings_cache() -> None:
     get_settings.cache_clear()
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_miss_executes_loader_and_writes_cache(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_TTL_SECONDS", "42")
@@ -72,7 +71,6 @@ async def test_get_or_set_miss_executes_loader_and_writes_cache(monkeypatch: pyt
     assert json.loads(payload) == {"value": 7}
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_hit_avoids_loader(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     _reset_settings_cache()
@@ -95,7 +93,6 @@ async def test_get_or_set_hit_avoids_loader(monkeypatch: pytest.MonkeyPatch) ->
     assert called == 0
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_redis_read_failure_falls_back_to_loader(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     _reset_settings_cache()
@@ -113,7 +110,6 @@ async def test_get_or_set_redis_read_failure_falls_back_to_loader(monkeypatch: p
     assert result == [1, 2, 3]
 
 
-@pytest.mark.asyncio
 async def test_refresh_overwrites_existing_cached_value(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     _reset_settings_cache()
@@ -133,7 +129,6 @@ async def test_refresh_overwrites_existing_cached_value(monkeypatch: pytest.Monk
     assert json.loads(fake_redis.store[key]) == {"score": 99}
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_coalesces_concurrent_cache_misses(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     _reset_settings_cache()
@@ -161,7 +156,6 @@ async def test_get_or_set_coalesces_concurrent_cache_misses(monkeypatch: pytest.
     assert called == 1
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_uses_in_memory_fallback_when_redis_unavailable(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -186,7 +180,6 @@ async def test_get_or_set_uses_in_memory_fallback_when_redis_unavailable(
     assert called == 1
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_does_not_use_memory_cache_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "false")
     _reset_settings_cache()
@@ -207,7 +200,6 @@ async def test_get_or_set_does_not_use_memory_cache_when_disabled(monkeypatch: p
     assert called == 2
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_skips_large_payloads_in_memory_cache(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_MEMORY_MAX_PAYLOAD_BYTES", "16")
@@ -231,7 +223,6 @@ async def test_get_or_set_skips_large_payloads_in_memory_cache(monkeypatch: pyte
     assert cache._memory_cache_bytes == 0
 
 
-@pytest.mark.asyncio
 async def test_get_or_set_evicts_oldest_memory_payloads_by_total_size(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_MEMORY_MAX_BYTES", "48")
@@ -152,7 +152,6 @@ class FakeStore:
         )
 
 
-@pytest.mark.asyncio
 async def test_warm_api_cache_warms_global_and_impacted_service_keys(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_IMPACTED_SERVICE_LIMIT", "1")
@@ -174,7 +173,6 @@ async def test_warm_api_cache_warms_global_and_impacted_service_keys(monkeypatch
     assert "services:vercel:detail" not in cache.keys
 
 
-@pytest.mark.asyncio
 async def test_warm_api_cache_continues_when_individual_key_warm_fails(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_IMPACTED_SERVICE_LIMIT", "1")
@@ -190,7 +188,6 @@ async def test_warm_api_cache_continues_when_individual_key_warm_fails(monkeypat
     assert "services:stripe:checker-trend:24h" in cache.keys
 
 
-@pytest.mark.asyncio
 async def test_warm_api_cache_can_include_top_viewed_services(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_IMPACTED_SERVICE_LIMIT", "0")
@@ -209,7 +206,6 @@ async def test_warm_api_cache_can_include_top_viewed_services(monkeypatch: pytes
     assert "services:stripe:detail" not in cache.keys
 
 
-@pytest.mark.asyncio
 async def test_warm_api_cache_skips_when_cache_is_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "false")
     _reset_settings_cache()
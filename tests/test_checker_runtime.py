@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 
 import httpx
@@ -7,6 +8,7 @@ import pytest
 
 from is_it_down.checkers.base import BaseCheck, BaseServiceChecker
 from is_it_down.core.models import CheckResult
+from is_it_down.scripts import checker_runtime
 from is_it_down.scripts.checker_runtime import (
     discover_service_checkers,
     execute_service_checkers,
@@ -14,6 +16,8 @@ from is_it_down.scripts.checker_runtime import (
     service_checker_path,
 )
 
+_OBSERVED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 class DummyCheck(BaseCheck):
     check_key = "dummy_check"
@@ -23,7 +27,7 @@ class DummyCheck(BaseCheck):
         return CheckResult(
             check_key=self.check_key,
             status="up",
-            observed_at=datetime.now(UTC),
+            observed_at=_OBSERVED_AT,
             http_status=200,
             latency_ms=1,
         )
@@ -37,16 +41,12 @@ class DummyServiceChecker(BaseServiceChecker):
         return [DummyCheck()]
 
 
-def _build_dummy_service_checker(index: int) -> type[BaseServiceChecker]:
-    class IndexedDummyServiceChecker(BaseServiceChecker):
-        service_key = f"dummy_{index}"
-        logo_url = "https://example.com/logo.svg"
-
-        def build_checks(self) -> list[BaseCheck]:
-            return [DummyCheck()]
-
-    IndexedDummyServiceChecker.__name__ = f"IndexedDummyServiceChecker{index}"
-    return IndexedDummyServiceChecker
+@pytest.fixture(scope="module")
+def many_service_checker_classes() -> list[type[BaseServiceChecker]]:
+    return [
+        type(f"IndexedDummyServiceChecker{index}", (DummyServiceChecker,), {"service_key": f"dummy_{index}"})
+        for index in range(100)
+    ]
 
 
 def test_service_checker_path_returns_fully_qualified_name() -> None:
@@ -54,9 +54,17 @@ def test_service_checker_path_returns_fully_qualified_name() -> None:
     assert path.endswith(".DummyServiceChecker")
 
 
+def test_discover_service_checkers_is_cached_and_read_only() -> None:
+    discovered = discover_service_checkers()
+
+    assert discover_service_checkers() is discovered
+    with pytest.raises(TypeError):
+        discovered["new-key"] = DummyServiceChecker  # type: ignore[index]
+
+
 def test_resolve_service_checker_targets_de_dupes_entries() -> None:
     discovered = discover_service_checkers()
-    target_key = next(iter(sorted(discovered)))
+    target_key = min(discovered)
     target_cls = discovered[target_key]
     target_path = service_checker_path(target_cls)
 
@@ -65,18 +73,70 @@ def test_resolve_service_checker_targets_de_dupes_entries() -> None:
     assert resolved[0] is target_cls
 
 
-@pytest.mark.asyncio
-async def test_execute_service_checkers_supports_concurrent_mode() -> None:
-    runs = await execute_service_checkers([DummyServiceChecker], concurrent=True, concurrency_limit=1)
+def test_resolve_service_checker_targets_looks_up_repeated_paths_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    target_path = service_checker_path(DummyServiceChecker)
+    looked_up: list[str] = []
+
+    def fake_get_service_checker(path: str) -> type[BaseServiceChecker]:
+        looked_up.append(path)
+        return DummyServiceChecker
+
+    monkeypatch.setattr(checker_runtime.registry, "get_service_checker", fake_get_service_checker)
+
+    resolved = resolve_service_checker_targets([target_path, target_path, target_path])
+    assert resolved == [DummyServiceChecker]
+    assert looked_up == [target_path]
+
+
+async def test_execute_service_checkers_supports_concurrent_mode(http_client: httpx.AsyncClient) -> None:
+    runs = await execute_service_checkers(
+        [DummyServiceChecker], concurrent=True, concurrency_limit=1, client=http_client
+    )
     assert len(runs) == 1
     assert runs[0][1].service_key == "dummy"
 
 
-@pytest.mark.asyncio
-async def test_execute_service_checkers_handles_many_service_classes() -> None:
-    checker_classes = [_build_dummy_service_checker(index) for index in range(100)]
-    runs = await execute_service_checkers(checker_classes, concurrent=True, concurrency_limit=20)
+@pytest.mark.slow
+@pytest.mark.parametrize("concurrency_limit", [20, 100])
+async def test_execute_service_checkers_handles_many_service_classes(
+    many_service_checker_classes: list[type[BaseServiceChecker]],
+    concurrency_limit: int,
+    http_client: httpx.AsyncClient,
+) -> None:
+    runs = await execute_service_checkers(
+        many_service_checker_classes,
+        concurrent=True,
+        concurrency_limit=concurrency_limit,
+        client=http_client,
+    )
 
     assert len(runs) == 100
     assert all(run_result.service_key.startswith("dummy_") for _, run_result in runs)
     assert all(run_result.check_results[0].status == "up" for _, run_result in runs)
+
+
+def test_concurrency_gate_skips_semaphore_when_limit_covers_all_checkers() -> None:
+    assert not isinstance(checker_runtime._concurrency_gate(10, 10), asyncio.Semaphore)
+    assert not isinstance(checker_runtime._concurrency_gate(11, 10), asyncio.Semaphore)
+    assert isinstance(checker_runtime._concurrency_gate(9, 10), asyncio.Semaphore)
+
+
+async def test_execute_service_checkers_concurrent_mode_preserves_input_order(http_client: httpx.AsyncClient) -> None:
+    class SlowCheck(DummyCheck):
+        async def run(self, client: httpx.AsyncClient) -> CheckResult:
+            await asyncio.sleep(0.02)
+            return await super().run(client)
+
+    class SlowServiceChecker(BaseServiceChecker):
+        service_key = "slow"
+        logo_url = "https://example.com/logo.svg"
+
+        def build_checks(self) -> list[BaseCheck]:
+            return [SlowCheck()]
+
+    runs = await execute_service_checkers(
+        [SlowServiceChecker, DummyServiceChecker], concurrent=True, client=http_client
+    )
+
+    assert [run_result.service_key for _, run_result in runs] == ["slow", "dummy"]
+
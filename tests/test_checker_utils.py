@@ -9,49 +9,39 @@ from is_it_down.checkers.http_client import (
 )
 from is_it_down.checkers.utils import build_response_debug_blob, json_dict_or_none, json_list_or_none
 
-
-def _response_with_json(payload: object) -> httpx.Response:
-    request = httpx.Request("GET", "https://example.com")
-    return httpx.Response(200, json=payload, request=request)
-
-
-def _response_with_text(payload: str) -> httpx.Response:
-    request = httpx.Request("GET", "https://example.com")
-    return httpx.Response(200, text=payload, request=request)
+_REQUEST = httpx.Request("GET", "https://example.com")
+# Responses built from in-memory content can be read repeatedly, so read-only tests share them.
+_MAPPING_RESPONSE = httpx.Response(200, json={"status": "ok"}, request=_REQUEST)
+_LIST_RESPONSE = httpx.Response(200, json=[{"id": 1}], request=_REQUEST)
+_INVALID_JSON_RESPONSE = httpx.Response(200, text="not json", request=_REQUEST)
 
 
 def test_json_dict_or_none_returns_mapping() -> None:
-    response = _response_with_json({"status": "ok"})
-    assert json_dict_or_none(response) == {"status": "ok"}
+    assert json_dict_or_none(_MAPPING_RESPONSE) == {"status": "ok"}
 
 
 def test_json_dict_or_none_returns_none_for_non_mapping() -> None:
-    response = _response_with_json(["a", "b"])
-    assert json_dict_or_none(response) is None
+    assert json_dict_or_none(_LIST_RESPONSE) is None
 
 
 def test_json_dict_or_none_returns_none_for_invalid_json() -> None:
-    response = _response_with_text("not json")
-    assert json_dict_or_none(response) is None
+    assert json_dict_or_none(_INVALID_JSON_RESPONSE) is None
 
 
 def test_json_list_or_none_returns_list() -> None:
-    response = _response_with_json([{"id": 1}])
-    assert json_list_or_none(response) == [{"id": 1}]
+    assert json_list_or_none(_LIST_RESPONSE) == [{"id": 1}]
 
 
 def test_json_list_or_none_returns_none_for_non_list() -> None:
-    response = _response_with_json({"id": 1})
-    assert json_list_or_none(response) is None
+    assert json_list_or_none(_MAPPING_RESPONSE) is None
 
 
 def test_json_list_or_none_returns_none_for_invalid_json() -> None:
-    response = _response_with_text("invalid")
-    assert json_list_or_none(response) is None
+    assert json_list_or_none(_INVALID_JSON_RESPONSE) is None
 
 
 def test_build_response_debug_blob_includes_client_truncation_metadata() -> None:
-    response = _response_with_text("example payload")
+    response = httpx.Response(200, content=b"example payload", request=_REQUEST)
     response.extensions[BODY_TRUNCATED_EXTENSION_KEY] = True
     response.extensions[BODY_LIMIT_EXTENSION_KEY] = 16
     response.extensions[BODY_SIZE_EXTENSION_KEY] = 16
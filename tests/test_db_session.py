@@ -0,0 +1,15 @@
+import json
+
+from is_it_down.db.session import _json_serializer
+
+
+def test_json_serializer_falls_back_to_stdlib_for_wide_integers() -> None:
+    document = _json_serializer({"bytes": 2**70, "codes": {503: 2}})
+
+    assert json.loads(document) == {"bytes": 2**70, "codes": {"503": 2}}
+
+
+def test_json_serializer_writes_non_finite_floats_as_null() -> None:
+    document = _json_serializer({"ratio": float("nan"), "peak": float("inf"), "floor": float("-inf")})
+
+    assert json.loads(document) == {"ratio": None, "peak": None, "floor": None}
@@ -0,0 +1,8 @@
+from is_it_down.core.event_loop import run_entrypoint
+
+
+def test_run_entrypoint_returns_coroutine_result() -> None:
+    async def _answer() -> int:
+        return 42
+
+    assert run_entrypoint(_answer()) == 42
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from google.cloud import bigquery
@@ -9,23 +12,60 @@ from is_it_down.scripts import find_failing_base_checkers
 from is_it_down.settings import Settings
 
 
-class _FakeQueryJob:
-    def __init__(self, rows):  # type: ignore[no-untyped-def]
-        self._rows = rows
+def _fake_client(rows: list[Any], project: str | None = "adc-project") -> SimpleNamespace:
+    query_calls: list[tuple[str, bigquery.QueryJobConfig]] = []
 
-    def result(self):  # type: ignore[no-untyped-def]
-        return self._rows
+    def _query(query: str, job_config: bigquery.QueryJobConfig) -> SimpleNamespace:
+        query_calls.append((query, job_config))
+        return SimpleNamespace(result=lambda: rows)
 
+    return SimpleNamespace(project=project, query=_query, query_calls=query_calls)
 
-class _FakeClient:
-    def __init__(self, rows, project: str | None = "adc-project"):  # type: ignore[no-untyped-def]
-        self.rows = rows
-        self.project = project
-        self.query_calls: list[tuple[str, bigquery.QueryJobConfig]] = []
 
-    def query(self, query: str, job_config: bigquery.QueryJobConfig) -> _FakeQueryJob:
-        self.query_calls.append((query, job_config))
-        return _FakeQueryJob(self.rows)
+@pytest.fixture(scope="module")
+def settings_variants() -> dict[str, Settings]:
+    # Settings are frozen, so these env-free, unvalidated instances are safe to share across tests.
+    return {
+        "configured_project": Settings.model_construct(
+            bigquery_project_id="configured-project",
+            bigquery_dataset_id="dataset_a",
+            bigquery_table_id="table_a",
+        ),
+        "no_project": Settings.model_construct(
+            bigquery_project_id=None,
+            bigquery_dataset_id="dataset_a",
+            bigquery_table_id="table_a",
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def base_sample() -> find_failing_base_checkers.FailingSample:
+    return find_failing_base_checkers.FailingSample(
+        observed_at=datetime(2026, 2, 26, 2, 0, tzinfo=UTC),
+        status="down",
+        latency_ms=500,
+        http_status=502,
+        error_code="http_error",
+        error_message="bad gateway",
+        metadata_json='{"debug":"sample"}',
+        run_id="run-10",
+        execution_id="exec-10",
+    )
+
+
+@pytest.fixture(scope="module")
+def base_group(base_sample: find_failing_base_checkers.FailingSample) -> find_failing_base_checkers.FailingGroup:
+    return find_failing_base_checkers.FailingGroup(
+        service_key="notion",
+        check_key="notion_status_page",
+        failing_count=3,
+        degraded_count=2,
+        down_count=1,
+        first_seen=datetime(2026, 2, 26, 1, 0, tzinfo=UTC),
+        last_seen=datetime(2026, 2, 26, 2, 0, tzinfo=UTC),
+        samples=[base_sample],
+    )
 
 
 def test_build_parser_uses_expected_defaults() -> None:
@@ -40,39 +80,29 @@ def test_build_parser_uses_expected_defaults() -> None:
     assert args.json is False
 
 
-def test_resolve_table_id_prefers_settings_project() -> None:
-    settings = Settings(
-        bigquery_project_id="configured-project",
-        bigquery_dataset_id="dataset_a",
-        bigquery_table_id="table_a",
-    )
-    client = _FakeClient(rows=[], project="adc-project")
+def test_resolve_table_id_prefers_settings_project(settings_variants: dict[str, Settings]) -> None:
+    settings = settings_variants["configured_project"]
+    client = _fake_client(rows=[], project="adc-project")
 
     table_id = find_failing_base_checkers._resolve_table_id(client, settings)
 
     assert table_id == "configured-project.dataset_a.table_a"
 
 
-def test_resolve_table_id_uses_adc_project_when_settings_project_missing() -> None:
-    settings = Settings(
-        bigquery_project_id=None,
-        bigquery_dataset_id="dataset_a",
-        bigquery_table_id="table_a",
-    )
-    client = _FakeClient(rows=[], project="adc-project")
+def test_resolve_table_id_uses_adc_project_when_settings_project_missing(
+    settings_variants: dict[str, Settings],
+) -> None:
+    settings = settings_variants["no_project"]
+    client = _fake_client(rows=[], project="adc-project")
 
     table_id = find_failing_base_checkers._resolve_table_id(client, settings)
 
     assert table_id == "adc-project.dataset_a.table_a"
 
 
-def test_resolve_table_id_raises_when_project_missing() -> None:
-    settings = Settings(
-        bigquery_project_id=None,
-        bigquery_dataset_id="dataset_a",
-        bigquery_table_id="table_a",
-    )
-    client = _FakeClient(rows=[], project=None)
+def test_resolve_table_id_raises_when_project_missing(settings_variants: dict[str, Settings]) -> None:
+    settings = settings_variants["no_project"]
+    client = _fake_client(rows=[], project=None)
 
     with pytest.raises(RuntimeError):
         find_failing_base_checkers._resolve_table_id(client, settings)
@@ -104,7 +134,7 @@ def test_query_failing_base_checks_builds_expected_query_and_parameters() -> Non
             ],
         }
     ]
-    client = _FakeClient(rows=rows)
+    client = _fake_client(rows=rows)
 
     groups = find_failing_base_checkers._query_failing_base_checks(
         client=client,
@@ -133,14 +163,19 @@ def test_query_failing_base_checks_builds_expected_query_and_parameters() -> Non
     assert "FROM `project.dataset.check_results`" in query
     assert "status IN ('degraded', 'down')" in query
 
-    parameters = {parameter.name: parameter for parameter in job_config.query_parameters}
-    assert parameters["lookback_hours"].value == 48
-    assert parameters["sample_limit"].value == 2
-    assert parameters["max_groups"].value == 50
-    assert parameters["has_service_filters"].value is True
-    assert parameters["has_check_filters"].value is True
-    assert parameters["service_keys"].values == ["cloudflare"]
-    assert parameters["check_keys"].values == ["cloudflare_status_api"]
+    parameters = {
+        parameter.name: parameter.values if isinstance(parameter, bigquery.ArrayQueryParameter) else parameter.value
+        for parameter in job_config.query_parameters
+    }
+    assert parameters == {
+        "lookback_hours": 48,
+        "sample_limit": 2,
+        "max_groups": 50,
+        "has_service_filters": True,
+        "has_check_filters": True,
+        "service_keys": ["cloudflare"],
+        "check_keys": ["cloudflare_status_api"],
+    }
 
 
 def test_render_human_report_handles_empty_results() -> None:
@@ -159,32 +194,11 @@ def test_render_human_report_handles_empty_results() -> None:
     assert "Check filter: (all)" in report
 
 
-def test_render_human_report_includes_group_and_samples() -> None:
-    group = find_failing_base_checkers.FailingGroup(
-        service_key="notion",
-        check_key="notion_status_page",
-        failing_count=3,
-        degraded_count=2,
-        down_count=1,
-        first_seen=datetime(2026, 2, 26, 1, 0, tzinfo=UTC),
-        last_seen=datetime(2026, 2, 26, 2, 0, tzinfo=UTC),
-        samples=[
-            find_failing_base_checkers.FailingSample(
-                observed_at=datetime(2026, 2, 26, 2, 0, tzinfo=UTC),
-                status="down",
-                latency_ms=500,
-                http_status=502,
-                error_code="http_error",
-                error_message="bad gateway",
-                metadata_json='{"debug":"sample"}',
-                run_id="run-10",
-                execution_id="exec-10",
-            )
-        ],
-    )
-
+def test_render_human_report_includes_group_and_samples(
+    base_group: find_failing_base_checkers.FailingGroup,
+) -> None:
     report = find_failing_base_checkers._render_human_report(
-        groups=[group],
+        groups=[base_group],
         table_id="project.dataset.check_results",
         lookback_hours=48,
         service_keys=["notion"],
@@ -198,8 +212,23 @@ def test_render_human_report_includes_group_and_samples() -> None:
     assert 'metadata={"debug":"sample"}' in report
 
 
-def test_json_payload_contains_expected_schema() -> None:
-    group = find_failing_base_checkers.FailingGroup(
+def test_json_payload_contains_expected_schema(
+    base_group: find_failing_base_checkers.FailingGroup,
+    base_sample: find_failing_base_checkers.FailingSample,
+) -> None:
+    sample = replace(
+        base_sample,
+        observed_at=datetime(2026, 2, 26, 11, 0, tzinfo=UTC),
+        latency_ms=1200,
+        http_status=503,
+        error_code="timeout",
+        error_message="request timed out",
+        metadata_json='{"path":"/v1/charges"}',
+        run_id="run-22",
+        execution_id="exec-22",
+    )
+    group = replace(
+        base_group,
         service_key="stripe",
         check_key="stripe_api_auth",
         failing_count=4,
@@ -207,19 +236,7 @@ def test_json_payload_contains_expected_schema() -> None:
         down_count=3,
         first_seen=datetime(2026, 2, 26, 10, 0, tzinfo=UTC),
         last_seen=datetime(2026, 2, 26, 11, 0, tzinfo=UTC),
-        samples=[
-            find_failing_base_checkers.FailingSample(
-                observed_at=datetime(2026, 2, 26, 11, 0, tzinfo=UTC),
-                status="down",
-                latency_ms=1200,
-                http_status=503,
-                error_code="timeout",
-                error_message="request timed out",
-                metadata_json='{"path":"/v1/charges"}',
-                run_id="run-22",
-                execution_id="exec-22",
-            )
-        ],
+        samples=[sample],
     )
 
     payload = find_failing_base_checkers._json_payload(
@@ -1,46 +1,47 @@
 from __future__ import annotations
 
 import ast
+import os
+import re
+from collections import deque
+from collections.abc import Iterator
+from itertools import chain
 from pathlib import Path
+from typing import cast
 
-SRC_ROOT = Path("src")
-
-
-class _LocalControlFlowVisitor(ast.NodeVisitor):
-    def __init__(self) -> None:
-        self.has_non_none_return = False
-        self.has_yield = False
-
-    def visit_Return(self, node: ast.Return) -> None:  # noqa: N802
-        if node.value is not None:
-            self.has_non_none_return = True
-
-    def visit_Yield(self, node: ast.Yield) -> None:  # noqa: N802
-        self.has_yield = True
-
-    def visit_YieldFrom(self, node: ast.YieldFrom) -> None:  # noqa: N802
-        self.has_yield = True
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
-        return
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # noqa: N802
-        return
+import pytest
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        return
+SRC_ROOT = Path("src")
+_ISSUES_CACHE_KEY = "is_it_down/docstring_issues"
+# Raw docstrings keep their source indentation, so section headers may be indented.
+_SECTION_HEADER_RE = re.compile(r"^[ \t]*(Args|Yields|Returns):$", re.MULTILINE)
+_IMPLICIT_ARGS = frozenset(("self", "cls"))
+_FUNCTION_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+_NESTED_SCOPE_TYPES = _FUNCTION_TYPES | {ast.ClassDef}
+_YIELD_TYPES = frozenset((ast.Yield, ast.YieldFrom))
+_STATEMENT_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
 
 
 def _iter_functions(tree: ast.AST) -> list[ast.FunctionDef | ast.AsyncFunctionDef]:
-    return [node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    # Definitions only appear in statement blocks, so descend through those instead of every expression node.
+    functions: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
+    pending: deque[ast.AST] = deque([tree])
+    while pending:
+        node = pending.popleft()
+        for field in _STATEMENT_BLOCK_FIELDS:
+            for child in getattr(node, field, ()):
+                if type(child) in _FUNCTION_TYPES:
+                    functions.append(child)
+                pending.append(child)
+    return functions
 
 
 def _function_args(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[str]:
-    args: list[str] = []
-    for arg in list(node.args.posonlyargs) + list(node.args.args) + list(node.args.kwonlyargs):
-        if arg.arg in {"self", "cls"}:
-            continue
-        args.append(arg.arg)
+    args = [
+        arg.arg
+        for arg in chain(node.args.posonlyargs, node.args.args, node.args.kwonlyargs)
+        if arg.arg not in _IMPLICIT_ARGS
+    ]
 
     if node.args.vararg is not None:
         args.append(f"*{node.args.vararg.arg}")
@@ -59,53 +60,109 @@ def _is_none_annotation(annotation: ast.expr | None) -> bool:
     return False
 
 
-def _analyze_local_flow(node: ast.FunctionDef | ast.AsyncFunctionDef) -> _LocalControlFlowVisitor:
-    visitor = _LocalControlFlowVisitor()
-    for stmt in node.body:
-        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str):
+def _string_constant(stmt: ast.stmt) -> str | None:
+    if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str):
+        return stmt.value.value
+    return None
+
+
+def _raw_docstring(node: ast.Module | ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef) -> str | None:
+    return _string_constant(node.body[0]) if node.body else None
+
+
+def _analyze_local_flow(node: ast.FunctionDef | ast.AsyncFunctionDef) -> tuple[bool, bool]:
+    # Returns no longer matter once a function yields, so the walk stops at the first yield.
+    has_non_none_return = False
+    stack: list[ast.AST] = [stmt for stmt in node.body if _string_constant(stmt) is None]
+    while stack:
+        current = stack.pop()
+        node_type = type(current)
+        if node_type in _YIELD_TYPES:
+            return has_non_none_return, True
+        if node_type in _NESTED_SCOPE_TYPES or node_type is ast.Lambda:
+            continue
+        if node_type is ast.Return:
+            has_non_none_return = has_non_none_return or cast(ast.Return, current).value is not None
+        stack.extend(ast.iter_child_nodes(current))
+    return has_non_none_return, False
+
+
+def _iter_source_files(root: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_source_files(Path(entry.path))
+            elif entry.name.endswith(".py"):
+                yield Path(entry.path), entry.stat()
+
+
+def _analyze_file(file_path: Path) -> list[str]:
+    issues: list[str] = []
+    tree = ast.parse(file_path.read_bytes())
+    relative = file_path.as_posix()
+
+    if _raw_docstring(tree) is None:
+        issues.append(f"{relative}: missing module docstring")
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and _raw_docstring(node) is None:
+            issues.append(f"{relative}:{node.lineno}: class `{node.name}` missing docstring")
+
+    for node in _iter_functions(tree):
+        docstring = _raw_docstring(node)
+        if docstring is None:
+            issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing docstring")
             continue
-        visitor.visit(stmt)
-    return visitor
 
+        sections = set(_SECTION_HEADER_RE.findall(docstring))
+        args = _function_args(node)
+        if args and "Args" not in sections:
+            issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing Args section")
+
+        has_non_none_return, expects_yields = _analyze_local_flow(node)
+        expects_returns = (not expects_yields) and (
+            has_non_none_return or (node.returns is not None and not _is_none_annotation(node.returns))
+        )
+        if expects_yields and "Yields" not in sections:
+            issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing Yields section")
+        if expects_returns and "Returns" not in sections:
+            issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing Returns section")
+
+    return issues
+
+
+def _missing_docstring_issues(cache: pytest.Cache | None = None) -> list[str]:
+    # Per-file results are reused across runs while the file and this validator are unchanged.
+    validator_mtime_ns = Path(__file__).stat().st_mtime_ns
+    cached: dict[str, list[object]] = {}
+    if cache is not None:
+        stored = cache.get(_ISSUES_CACHE_KEY, None)
+        if isinstance(stored, dict) and stored.get("validator_mtime_ns") == validator_mtime_ns:
+            cached = stored.get("files", {})
+
+    file_stats: dict[Path, tuple[int, int]] = {}
+    results: dict[Path, list[str]] = {}
+    for file_path, stat in sorted(_iter_source_files(SRC_ROOT)):
+        file_stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+        entry = cached.get(file_path.as_posix())
+        if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            results[file_path] = cast(list[str], entry[2])
+
+    stale = [file_path for file_path in file_stats if file_path not in results]
+    results.update((file_path, _analyze_file(file_path)) for file_path in stale)
 
-def _missing_docstring_issues() -> list[str]:
     issues: list[str] = []
-    for file_path in sorted(SRC_ROOT.rglob("*.py")):
-        source = file_path.read_text()
-        tree = ast.parse(source)
-        relative = file_path.as_posix()
-
-        if ast.get_docstring(tree) is None:
-            issues.append(f"{relative}: missing module docstring")
-
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef) and ast.get_docstring(node) is None:
-                issues.append(f"{relative}:{node.lineno}: class `{node.name}` missing docstring")
-
-        for node in _iter_functions(tree):
-            docstring = ast.get_docstring(node)
-            if docstring is None:
-                issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing docstring")
-                continue
-
-            doc = f"\n{docstring}\n"
-            args = _function_args(node)
-            if args and "\nArgs:\n" not in doc:
-                issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing Args section")
-
-            flow = _analyze_local_flow(node)
-            expects_yields = flow.has_yield
-            expects_returns = (not expects_yields) and (
-                flow.has_non_none_return or (node.returns is not None and not _is_none_annotation(node.returns))
-            )
-            if expects_yields and "\nYields:\n" not in doc:
-                issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing Yields section")
-            if expects_returns and "\nReturns:\n" not in doc:
-                issues.append(f"{relative}:{node.lineno}: function `{node.name}` missing Returns section")
+    files: dict[str, list[object]] = {}
+    for file_path, (mtime_ns, size) in file_stats.items():
+        files[file_path.as_posix()] = [mtime_ns, size, results[file_path]]
+        issues.extend(results[file_path])
 
+    if cache is not None:
+        cache.set(_ISSUES_CACHE_KEY, {"validator_mtime_ns": validator_mtime_ns, "files": files})
     return issues
 
 
-def test_src_docstrings_follow_google_sections() -> None:
-    issues = _missing_docstring_issues()
+def test_src_docstrings_follow_google_sections(request: pytest.FixtureRequest) -> None:
+    # `config.cache` is absent when the cacheprovider plugin is disabled (`-p no:cacheprovider`).
+    issues = _missing_docstring_issues(getattr(request.config, "cache", None))
     assert not issues, "Google docstring validation failed:\n" + "\n".join(issues)
@@ -1,3 +1,5 @@
+import pytest
+
 from is_it_down.core.granularity import (
     check_score_from_status,
     derive_check_status_detail,
@@ -8,20 +10,27 @@ from is_it_down.core.granularity import (
 )
 
 
-def test_score_band_and_severity_from_score() -> None:
-    assert score_band_from_score(100.0) == "excellent"
-    assert score_band_from_score(96.0) == "healthy"
-    assert score_band_from_score(83.0) == "minor_issues"
-    assert score_band_from_score(65.0) == "degraded"
-    assert score_band_from_score(45.0) == "major_issues"
-    assert score_band_from_score(10.0) == "critical"
-
-    assert severity_level_from_score(100.0) == 0
-    assert severity_level_from_score(95.0) == 1
-    assert severity_level_from_score(80.0) == 2
-    assert severity_level_from_score(60.0) == 3
-    assert severity_level_from_score(40.0) == 4
-    assert severity_level_from_score(0.0) == 5
+@pytest.mark.parametrize(
+    ("score", "expected_band"),
+    [
+        (100.0, "excellent"),
+        (96.0, "healthy"),
+        (83.0, "minor_issues"),
+        (65.0, "degraded"),
+        (45.0, "major_issues"),
+        (10.0, "critical"),
+    ],
+)
+def test_score_band_from_score(score: float, expected_band: str) -> None:
+    assert score_band_from_score(score) == expected_band
+
+
+@pytest.mark.parametrize(
+    ("score", "expected_level"),
+    [(100.0, 0), (95.0, 1), (80.0, 2), (60.0, 3), (40.0, 4), (0.0, 5)],
+)
+def test_severity_level_from_score(score: float, expected_level: int) -> None:
+    assert severity_level_from_score(score) == expected_level
 
 
 def test_derive_check_status_detail_uses_errors_and_signals() -> None:
@@ -1,29 +1,44 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 
 import httpx
-import pytest
+import pytest_asyncio
 
 from is_it_down.checkers.http_client import BoundedAsyncClient, response_body_truncation_metadata
 
+_JSON_PAYLOAD = {"message": "x" * 80}
 
-@pytest.mark.asyncio
-async def test_bounded_async_client_truncates_non_json_response() -> None:
-    def _handler(request: httpx.Request) -> httpx.Response:
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/json":
         return httpx.Response(
             status_code=200,
-            text="a" * 128,
-            headers={"content-type": "text/plain"},
+            content=json.dumps(_JSON_PAYLOAD),
+            headers={"content-type": "application/json"},
             request=request,
         )
+    return httpx.Response(
+        status_code=200,
+        text="a" * 128,
+        headers={"content-type": "text/plain"},
+        request=request,
+    )
+
 
+@pytest_asyncio.fixture(scope="module")
+async def bounded_client() -> AsyncIterator[BoundedAsyncClient]:
     async with BoundedAsyncClient(
         transport=httpx.MockTransport(_handler),
         max_response_body_bytes=32,
-        max_json_response_body_bytes=64,
+        max_json_response_body_bytes=1024,
     ) as client:
-        response = await client.get("https://example.com/plain")
+        yield client
+
+
+async def test_bounded_async_client_truncates_non_json_response(bounded_client: BoundedAsyncClient) -> None:
+    response = await bounded_client.get("https://example.com/plain")
 
     assert response.status_code == 200
     assert len(response.content) == 32
@@ -34,24 +49,8 @@ async def test_bounded_async_client_truncates_non_json_response() -> None:
     }
 
 
-@pytest.mark.asyncio
-async def test_bounded_async_client_uses_json_specific_limit() -> None:
-    payload = {"message": "x" * 80}
-
-    def _handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(
-            status_code=200,
-            content=json.dumps(payload),
-            headers={"content-type": "application/json"},
-            request=request,
-        )
-
-    async with BoundedAsyncClient(
-        transport=httpx.MockTransport(_handler),
-        max_response_body_bytes=32,
-        max_json_response_body_bytes=1024,
-    ) as client:
-        response = await client.get("https://example.com/json")
+async def test_bounded_async_client_uses_json_specific_limit(bounded_client: BoundedAsyncClient) -> None:
+    response = await bounded_client.get("https://example.com/json")
 
-    assert response.json() == payload
+    assert response.json() == _JSON_PAYLOAD
     assert response_body_truncation_metadata(response) == {}
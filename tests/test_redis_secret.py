@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import pytest
 
 from is_it_down.cache.redis_secret import (
@@ -9,61 +11,51 @@ from is_it_down.cache.redis_secret import (
 from is_it_down.settings import get_settings
 
 
-def _reset_settings_cache() -> None:
+@pytest.fixture
+def _fresh_settings() -> Iterator[None]:
+    get_settings.cache_clear()
+    clear_redis_secret_resolution_cache()
+    yield
     get_settings.cache_clear()
     clear_redis_secret_resolution_cache()
 
 
 def test_resolve_secret_name_keeps_fully_qualified_secret_version() -> None:
-    _reset_settings_cache()
-    try:
-        name = _resolve_secret_name("projects/demo/secrets/redis-url/versions/5")
-    finally:
-        _reset_settings_cache()
+    name = _resolve_secret_name("projects/demo/secrets/redis-url/versions/5")
 
     assert name == "projects/demo/secrets/redis-url/versions/5"
 
 
 def test_resolve_secret_name_appends_latest_for_fully_qualified_secret() -> None:
-    _reset_settings_cache()
-    try:
-        name = _resolve_secret_name("projects/demo/secrets/redis-url")
-    finally:
-        _reset_settings_cache()
+    name = _resolve_secret_name("projects/demo/secrets/redis-url")
 
     assert name == "projects/demo/secrets/redis-url/versions/latest"
 
 
+@pytest.mark.usefixtures("_fresh_settings")
 def test_resolve_secret_name_uses_redis_secret_project(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_REDIS_SECRET_PROJECT_ID", "demo-project")
-    _reset_settings_cache()
-    try:
-        name = _resolve_secret_name("redis-url")
-    finally:
-        _reset_settings_cache()
+
+    name = _resolve_secret_name("redis-url")
 
     assert name == "projects/demo-project/secrets/redis-url/versions/latest"
 
 
+@pytest.mark.usefixtures("_fresh_settings")
 def test_resolve_secret_name_requires_project_for_short_secret_id(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_REDIS_SECRET_PROJECT_ID", "")
     monkeypatch.setenv("IS_IT_DOWN_BIGQUERY_PROJECT_ID", "")
-    _reset_settings_cache()
-    try:
-        with pytest.raises(RedisSecretConfigurationError):
-            _resolve_secret_name("redis-url")
-    finally:
-        _reset_settings_cache()
+
+    with pytest.raises(RedisSecretConfigurationError):
+        _resolve_secret_name("redis-url")
 
 
+@pytest.mark.usefixtures("_fresh_settings")
 def test_default_redis_url_from_settings_bypasses_secret_manager(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_IT_DOWN_API_CACHE_REDIS_URL", "redis://127.0.0.1:6379")
     monkeypatch.delenv("IS_IT_DOWN_API_CACHE_REDIS_SECRET_ID", raising=False)
     monkeypatch.delenv("IS_IT_DOWN_REDIS_SECRET_PROJECT_ID", raising=False)
-    _reset_settings_cache()
-    try:
-        redis_url = resolve_api_cache_redis_url_sync()
-    finally:
-        _reset_settings_cache()
+
+    redis_url = resolve_api_cache_redis_url_sync()
 
     assert redis_url == "redis://127.0.0.1:6379"
@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 import pytest
@@ -5,7 +6,9 @@ import pytest
 from is_it_down.checkers.base import BaseServiceChecker, ServiceRunResult
 from is_it_down.core.models import CheckResult
 from is_it_down.scripts import run_scheduled_checks
-from is_it_down.settings import get_settings
+from is_it_down.settings import Settings, get_settings
+
+_OBSERVED_AT = datetime(2024, 1, 1, tzinfo=UTC)
 
 
 class DummyServiceChecker(BaseServiceChecker):
@@ -16,111 +19,128 @@ class DummyServiceChecker(BaseServiceChecker):
         return []
 
 
-def _build_dummy_checker(service_key: str) -> type[BaseServiceChecker]:
-    checker_service_key = service_key
+_DUMMY_CHECKERS = {
+    key: type(f"DummyServiceChecker_{key}", (DummyServiceChecker,), {"service_key": key})
+    for key in ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf"]
+}
 
-    class _GeneratedDummyServiceChecker(BaseServiceChecker):
-        logo_url = "https://example.com/logo.svg"
-        service_key = checker_service_key
 
-        def build_checks(self) -> list:
-            return []
+def _reset_settings_cache() -> None:
+    get_settings.cache_clear()
 
-    return _GeneratedDummyServiceChecker
 
+# model_construct skips env parsing, so these settings only reflect field defaults plus the overrides.
+_CACHE_WARM_SETTINGS = Settings.model_construct(api_cache_enabled=True, api_cache_warm_on_checker_job=True)
 
-def _reset_settings_cache() -> None:
-    get_settings.cache_clear()
+_RUN_RESULT = ServiceRunResult(
+    service_key="dummy",
+    check_results=[
+        CheckResult(
+            check_key="dummy_check",
+            status="up",
+            observed_at=_OBSERVED_AT,
+        )
+    ],
+)
 
 
-@pytest.mark.asyncio
-async def test_run_once_warms_cache_after_bigquery_insert(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_ON_CHECKER_JOB", "true")
-    _reset_settings_cache()
+@dataclass
+class _PatchedRunner:
+    insert_calls: list[int] = field(default_factory=list)
+    warm_calls: list[int] = field(default_factory=list)
 
-    run_result = ServiceRunResult(
-        service_key="dummy",
-        check_results=[
-            CheckResult(
-                check_key="dummy_check",
-                status="up",
-                observed_at=datetime.now(UTC),
-            )
-        ],
-    )
 
-    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
-        yield DummyServiceChecker, run_result
+@pytest.fixture
+def patched_runner(monkeypatch: pytest.MonkeyPatch) -> _PatchedRunner:
+    runner = _PatchedRunner()
 
-    insert_calls: list[int] = []
-    warm_calls: list[int] = []
+    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
+        yield DummyServiceChecker, _RUN_RESULT
 
     def fake_insert_rows(rows):  # type: ignore[no-untyped-def]
-        insert_calls.append(len(rows))
+        runner.insert_calls.append(len(rows))
 
     async def fake_warm_api_cache() -> int:
-        warm_calls.append(1)
-        return 4
+        runner.warm_calls.append(1)
+        return 1
 
     monkeypatch.setattr(
         run_scheduled_checks,
         "_resolve_service_checker_classes",
         lambda targets, task_metadata=None: [DummyServiceChecker],
     )
+    monkeypatch.setattr(run_scheduled_checks, "get_settings", lambda: _CACHE_WARM_SETTINGS)
     monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
     monkeypatch.setattr(run_scheduled_checks, "_insert_rows", fake_insert_rows)
     monkeypatch.setattr(run_scheduled_checks, "warm_api_cache", fake_warm_api_cache)
+    return runner
 
+
+async def test_run_once_warms_cache_after_bigquery_insert(patched_runner: _PatchedRunner) -> None:
     await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
 
-    assert insert_calls == [1]
-    assert warm_calls == [1]
+    assert patched_runner.insert_calls == [1]
+    assert patched_runner.warm_calls == [1]
 
 
-@pytest.mark.asyncio
-async def test_run_once_dry_run_skips_insert_and_cache_warm(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_ON_CHECKER_JOB", "true")
-    _reset_settings_cache()
+async def test_run_once_dry_run_skips_insert_and_cache_warm(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
+    def fail_build_rows(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("_build_bigquery_rows_for_run should not be called in dry-run mode.")
 
-    run_result = ServiceRunResult(
-        service_key="dummy",
-        check_results=[
-            CheckResult(
-                check_key="dummy_check",
-                status="up",
-                observed_at=datetime.now(UTC),
-            )
-        ],
-    )
+    monkeypatch.setattr(run_scheduled_checks, "_build_bigquery_rows_for_run", fail_build_rows)
 
+    await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=True)
+
+    assert patched_runner.insert_calls == []
+    assert patched_runner.warm_calls == []
+
+
+async def test_run_once_inserts_rows_from_all_checkers_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
     async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
-        yield DummyServiceChecker, run_result
+        for _ in range(3):
+            yield DummyServiceChecker, _RUN_RESULT
 
-    insert_calls: list[int] = []
-    warm_calls: list[int] = []
+    monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
 
-    def fake_insert_rows(rows):  # type: ignore[no-untyped-def]
-        insert_calls.append(len(rows))
+    await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
 
-    async def fake_warm_api_cache() -> int:
-        warm_calls.append(1)
-        return 1
+    assert patched_runner.insert_calls == [3]
 
-    monkeypatch.setattr(
-        run_scheduled_checks,
-        "_resolve_service_checker_classes",
-        lambda targets, task_metadata=None: [DummyServiceChecker],
-    )
+
+async def test_run_once_flushes_rows_at_insert_batch_size(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
+    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
+        for _ in range(5):
+            yield DummyServiceChecker, _RUN_RESULT
+
+    small_batch_settings = _CACHE_WARM_SETTINGS.model_copy(update={"checker_insert_batch_size": 2})
+    monkeypatch.setattr(run_scheduled_checks, "get_settings", lambda: small_batch_settings)
     monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
-    monkeypatch.setattr(run_scheduled_checks, "_insert_rows", fake_insert_rows)
-    monkeypatch.setattr(run_scheduled_checks, "warm_api_cache", fake_warm_api_cache)
 
-    await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=True)
+    await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
 
-    assert insert_calls == []
-    assert warm_calls == []
+    assert patched_runner.insert_calls == [2, 2, 1]
+
+
+@pytest.mark.slow
+async def test_run_once_inserts_ten_thousand_rows_in_configured_batches(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
+    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
+        for _ in range(10_000):
+            yield DummyServiceChecker, _RUN_RESULT
+
+    monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
+
+    await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
+
+    batch_size = _CACHE_WARM_SETTINGS.checker_insert_batch_size
+    assert patched_runner.insert_calls == [batch_size] * (10_000 // batch_size)
 
 
 def test_resolve_cloud_run_task_metadata_returns_none_without_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -130,11 +150,20 @@ def test_resolve_cloud_run_task_metadata_returns_none_without_env(monkeypatch: p
     assert run_scheduled_checks._resolve_cloud_run_task_metadata() is None
 
 
+def test_resolve_run_id_uses_cloud_run_execution() -> None:
+    assert run_scheduled_checks._resolve_run_id("checker-job-abc12") == "checker-job-abc12"
+
+
+def test_resolve_run_id_generates_hex_token_without_execution() -> None:
+    run_id = run_scheduled_checks._resolve_run_id(None)
+
+    assert len(run_id) == 32
+    assert int(run_id, 16) >= 0
+    assert run_id != run_scheduled_checks._resolve_run_id(None)
+
+
 def test_resolve_service_checker_classes_shards_by_task(monkeypatch: pytest.MonkeyPatch) -> None:
-    checkers = {
-        key: _build_dummy_checker(key)
-        for key in ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot"]
-    }
+    checkers = {key: _DUMMY_CHECKERS[key] for key in ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot"]}
     monkeypatch.setattr(run_scheduled_checks, "discover_service_checkers", lambda: checkers)
 
     task_zero = run_scheduled_checks._resolve_service_checker_classes([], task_metadata=(0, 3))
@@ -149,11 +178,7 @@ def test_resolve_service_checker_classes_shards_by_task(monkeypatch: pytest.Monk
 def test_resolve_service_checker_classes_evenly_distributes_remainder(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    checkers = {
-        key: _build_dummy_checker(key)
-        for key in ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf"]
-    }
-    monkeypatch.setattr(run_scheduled_checks, "discover_service_checkers", lambda: checkers)
+    monkeypatch.setattr(run_scheduled_checks, "discover_service_checkers", lambda: _DUMMY_CHECKERS)
 
     task_zero = run_scheduled_checks._resolve_service_checker_classes([], task_metadata=(0, 3))
     task_one = run_scheduled_checks._resolve_service_checker_classes([], task_metadata=(1, 3))
@@ -164,150 +189,44 @@ def test_resolve_service_checker_classes_evenly_distributes_remainder(
     assert [checker.service_key for checker in task_two] == ["foxtrot", "golf"]
 
 
-@pytest.mark.asyncio
-async def test_run_once_non_primary_task_skips_cache_warm(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_ON_CHECKER_JOB", "true")
+async def test_run_once_non_primary_task_skips_cache_warm(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
     monkeypatch.setenv("CLOUD_RUN_TASK_INDEX", "1")
     monkeypatch.setenv("CLOUD_RUN_TASK_COUNT", "4")
-    _reset_settings_cache()
-
-    run_result = ServiceRunResult(
-        service_key="dummy",
-        check_results=[
-            CheckResult(
-                check_key="dummy_check",
-                status="up",
-                observed_at=datetime.now(UTC),
-            )
-        ],
-    )
-
-    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
-        yield DummyServiceChecker, run_result
-
-    insert_calls: list[int] = []
-    warm_calls: list[int] = []
-
-    def fake_insert_rows(rows):  # type: ignore[no-untyped-def]
-        insert_calls.append(len(rows))
-
-    async def fake_warm_api_cache() -> int:
-        warm_calls.append(1)
-        return 1
-
-    monkeypatch.setattr(
-        run_scheduled_checks,
-        "_resolve_service_checker_classes",
-        lambda targets, task_metadata=None: [DummyServiceChecker],
-    )
-    monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
-    monkeypatch.setattr(run_scheduled_checks, "_insert_rows", fake_insert_rows)
-    monkeypatch.setattr(run_scheduled_checks, "warm_api_cache", fake_warm_api_cache)
 
     await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
 
-    assert insert_calls == [1]
-    assert warm_calls == []
+    assert patched_runner.insert_calls == [1]
+    assert patched_runner.warm_calls == []
 
 
-@pytest.mark.asyncio
-async def test_run_once_primary_cloud_run_task_warms_cache_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_ON_CHECKER_JOB", "true")
-    monkeypatch.delenv("IS_IT_DOWN_API_CACHE_WARM_ON_CLOUD_RUN_CHECKER_JOB", raising=False)
+async def test_run_once_primary_cloud_run_task_warms_cache_by_default(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
     monkeypatch.setenv("CLOUD_RUN_TASK_INDEX", "0")
     monkeypatch.setenv("CLOUD_RUN_TASK_COUNT", "4")
-    _reset_settings_cache()
-
-    run_result = ServiceRunResult(
-        service_key="dummy",
-        check_results=[
-            CheckResult(
-                check_key="dummy_check",
-                status="up",
-                observed_at=datetime.now(UTC),
-            )
-        ],
-    )
-
-    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
-        yield DummyServiceChecker, run_result
-
-    insert_calls: list[int] = []
-    warm_calls: list[int] = []
-
-    def fake_insert_rows(rows):  # type: ignore[no-untyped-def]
-        insert_calls.append(len(rows))
-
-    async def fake_warm_api_cache() -> int:
-        warm_calls.append(1)
-        return 1
-
-    monkeypatch.setattr(
-        run_scheduled_checks,
-        "_resolve_service_checker_classes",
-        lambda targets, task_metadata=None: [DummyServiceChecker],
-    )
-    monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
-    monkeypatch.setattr(run_scheduled_checks, "_insert_rows", fake_insert_rows)
-    monkeypatch.setattr(run_scheduled_checks, "warm_api_cache", fake_warm_api_cache)
 
     await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
 
-    assert insert_calls == [1]
-    assert warm_calls == [1]
+    assert patched_runner.insert_calls == [1]
+    assert patched_runner.warm_calls == [1]
 
 
-@pytest.mark.asyncio
-async def test_run_once_primary_cloud_run_task_skips_cache_warm_when_opted_out(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_ENABLED", "true")
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_ON_CHECKER_JOB", "true")
-    monkeypatch.setenv("IS_IT_DOWN_API_CACHE_WARM_ON_CLOUD_RUN_CHECKER_JOB", "false")
+async def test_run_once_primary_cloud_run_task_skips_cache_warm_when_opted_out(
+    monkeypatch: pytest.MonkeyPatch, patched_runner: _PatchedRunner
+) -> None:
+    opted_out_settings = _CACHE_WARM_SETTINGS.model_copy(update={"api_cache_warm_on_cloud_run_checker_job": False})
+    monkeypatch.setattr(run_scheduled_checks, "get_settings", lambda: opted_out_settings)
     monkeypatch.setenv("CLOUD_RUN_TASK_INDEX", "0")
     monkeypatch.setenv("CLOUD_RUN_TASK_COUNT", "4")
-    _reset_settings_cache()
-
-    run_result = ServiceRunResult(
-        service_key="dummy",
-        check_results=[
-            CheckResult(
-                check_key="dummy_check",
-                status="up",
-                observed_at=datetime.now(UTC),
-            )
-        ],
-    )
-
-    async def fake_iter(*args, **kwargs):  # type: ignore[no-untyped-def]
-        yield DummyServiceChecker, run_result
-
-    insert_calls: list[int] = []
-    warm_calls: list[int] = []
-
-    def fake_insert_rows(rows):  # type: ignore[no-untyped-def]
-        insert_calls.append(len(rows))
-
-    async def fake_warm_api_cache() -> int:
-        warm_calls.append(1)
-        return 1
-
-    monkeypatch.setattr(
-        run_scheduled_checks,
-        "_resolve_service_checker_classes",
-        lambda targets, task_metadata=None: [DummyServiceChecker],
-    )
-    monkeypatch.setattr(run_scheduled_checks, "iter_service_checker_runs", fake_iter)
-    monkeypatch.setattr(run_scheduled_checks, "_insert_rows", fake_insert_rows)
-    monkeypatch.setattr(run_scheduled_checks, "warm_api_cache", fake_warm_api_cache)
 
     await run_scheduled_checks._run_once(targets=[], strict=False, dry_run=False)
 
-    assert insert_calls == [1]
-    assert warm_calls == []
+    assert patched_runner.insert_calls == [1]
+    assert patched_runner.warm_calls == []
 
 
-@pytest.mark.asyncio
 async def test_run_once_task_with_no_assigned_checkers_exits_cleanly(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("CLOUD_RUN_TASK_INDEX", "5")
     monkeypatch.setenv("CLOUD_RUN_TASK_COUNT", "6")
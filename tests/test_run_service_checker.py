@@ -1,12 +1,18 @@
+import io
+import json
+from collections.abc import Mapping
 from datetime import UTC, datetime
 
 import httpx
 import pytest
 
-from is_it_down.checkers.base import BaseCheck, BaseServiceChecker
+from is_it_down.checkers.base import BaseCheck, BaseServiceChecker, ServiceRunResult
 from is_it_down.core.models import CheckResult
 from is_it_down.scripts.run_service_checker import (
-    discover_service_checkers,
+    _dumps_json,
+    _print_human,
+    _serialize_run,
+    _write_json_runs,
     execute_service_checkers,
     resolve_service_checker_targets,
 )
@@ -34,24 +40,23 @@ class DummyServiceChecker(BaseServiceChecker):
         return [DummyCheck()]
 
 
-def test_discover_service_checkers_includes_cloudflare() -> None:
-    discovered = discover_service_checkers()
-    assert discovered
+def test_discover_service_checkers_includes_cloudflare(
+    discovered_checkers: Mapping[str, type[BaseServiceChecker]],
+) -> None:
+    assert discovered_checkers
 
 
-def test_resolve_service_checker_by_key() -> None:
-    discovered = discover_service_checkers()
-    target_key = next(iter(sorted(discovered)))
+def test_resolve_service_checker_by_key(discovered_checkers: Mapping[str, type[BaseServiceChecker]]) -> None:
+    target_key = min(discovered_checkers)
 
     resolved = resolve_service_checker_targets([target_key])
     assert len(resolved) == 1
     assert resolved[0].service_key == target_key
 
 
-def test_resolve_service_checker_by_class_path() -> None:
-    discovered = discover_service_checkers()
-    target_key = next(iter(sorted(discovered)))
-    target_cls = discovered[target_key]
+def test_resolve_service_checker_by_class_path(discovered_checkers: Mapping[str, type[BaseServiceChecker]]) -> None:
+    target_key = min(discovered_checkers)
+    target_cls = discovered_checkers[target_key]
     target_path = f"{target_cls.__module__}.{target_cls.__name__}"
 
     resolved = resolve_service_checker_targets([target_path])
@@ -64,12 +69,119 @@ def test_resolve_service_checker_rejects_unknown_key() -> None:
         resolve_service_checker_targets(["this-does-not-exist"])
 
 
-@pytest.mark.asyncio
-async def test_execute_service_checkers_runs_without_db() -> None:
-    runs = await execute_service_checkers([DummyServiceChecker])
+async def test_execute_service_checkers_runs_without_db(http_client: httpx.AsyncClient) -> None:
+    runs = await execute_service_checkers([DummyServiceChecker], client=http_client)
     assert len(runs) == 1
+    assert not http_client.is_closed
 
     _, run_result = runs[0]
     assert run_result.service_key == "dummy"
     assert len(run_result.check_results) == 1
     assert run_result.check_results[0].status == "up"
+
+
+def test_dumps_json_sorts_keys_and_indents() -> None:
+    compact = _dumps_json({"b": 1, "a": [True, None]})
+    assert json.loads(compact) == {"a": [True, None], "b": 1}
+    assert compact.index('"a"') < compact.index('"b"')
+    assert _dumps_json({"b": 1, "a": 2}, indent=True) == '{\n  "a": 2,\n  "b": 1\n}'
+
+
+def test_dumps_json_writes_non_string_keys_as_strings() -> None:
+    value = {"codes": {503: 2, 200: 1}}
+
+    assert json.loads(_dumps_json(value)) == {"codes": {"200": 1, "503": 2}}
+    assert json.loads(_dumps_json(value, indent=True)) == {"codes": {"200": 1, "503": 2}}
+
+
+def test_write_json_runs_matches_single_document_dump() -> None:
+    run_result = ServiceRunResult(
+        service_key="dummy",
+        check_results=[CheckResult(check_key="dummy_check", status="up", observed_at=datetime.now(UTC))],
+    )
+    runs = [(DummyServiceChecker, run_result), (DummyServiceChecker, run_result)]
+
+    stream = io.StringIO()
+    _write_json_runs(runs, stream)
+
+    expected = [_serialize_run(DummyServiceChecker, run_result)] * 2
+    assert stream.getvalue() == json.dumps(expected, indent=2, sort_keys=True) + "\n"
+
+
+def test_write_json_runs_keeps_stdlib_encoding_for_edge_case_metadata() -> None:
+    run_result = ServiceRunResult(
+        service_key="dummy",
+        check_results=[
+            CheckResult(
+                check_key="dummy_check",
+                status="degraded",
+                observed_at=datetime.now(UTC),
+                metadata={"detail": "café ✓", "ratio": float("nan"), "peak": float("inf"), "bytes": 2**70},
+            )
+        ],
+    )
+
+    stream = io.StringIO()
+    _write_json_runs([(DummyServiceChecker, run_result)], stream)
+
+    expected = [_serialize_run(DummyServiceChecker, run_result)]
+    assert stream.getvalue() == json.dumps(expected, indent=2, sort_keys=True) + "\n"
+    assert "caf\\u00e9 \\u2713" in stream.getvalue()
+    assert '"ratio": NaN' in stream.getvalue()
+
+
+def test_write_json_runs_handles_empty_list() -> None:
+    stream = io.StringIO()
+    _write_json_runs([], stream)
+
+    assert json.loads(stream.getvalue()) == []
+
+
+def test_print_human_formats_rows_in_fixed_columns(capsys: pytest.CaptureFixture[str]) -> None:
+    run_result = ServiceRunResult(
+        service_key="dummy",
+        check_results=[
+            CheckResult(
+                check_key="k" * 45,
+                status="down",
+                observed_at=datetime.now(UTC),
+                http_status=503,
+                latency_ms=12,
+                error_code="HTTP_ERROR",
+                error_message="bad",
+                metadata={"b": 1, "a": 2},
+            )
+        ],
+    )
+
+    _print_human(DummyServiceChecker, run_result, verbose=False)
+
+    lines = capsys.readouterr().out.split("\n")
+    assert lines[0].startswith("Service: dummy (")
+    assert lines[1] == f"{'CHECK':40} {'STATUS':9} {'LATENCY':9} {'HTTP':6} ERROR"
+    assert lines[2] == "-" * len(lines[1])
+    assert lines[3] == f"{'k' * 40} {'down':9} {'12ms':9} {'503':6} HTTP_ERROR: bad"
+    assert lines[4] == " " * 68 + 'metadata={"a": 2, "b": 1}'
+    assert lines[5:] == ["", ""]
+
+
+def test_print_human_verbose_payload_embeds_metadata(capsys: pytest.CaptureFixture[str]) -> None:
+    run_result = ServiceRunResult(
+        service_key="dummy",
+        check_results=[
+            CheckResult(
+                check_key="dummy_check",
+                status="down",
+                observed_at=datetime.now(UTC),
+                metadata={"status_detail": "timeout"},
+            )
+        ],
+    )
+
+    _print_human(DummyServiceChecker, run_result, verbose=True)
+
+    lines = capsys.readouterr().out.split("\n")
+    verbose_index = lines.index(" " * 68 + "verbose:")
+    payload = "\n".join(line[68:] for line in lines[verbose_index + 1 :] if line)
+    assert json.loads(payload)["metadata"] == {"status_detail": "timeout"}
+    assert '  "metadata": {\n    "status_detail": "timeout"\n  }' in payload
@@ -1,24 +1,40 @@
 from datetime import UTC, datetime
 
+import pytest
+
 from is_it_down.core.models import CheckResult
 from is_it_down.core.scoring import check_result_score, status_from_score, weighted_service_score
 
+_OBSERVED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 def _result(check_key: str, status: str, latency_ms: int | None = None) -> CheckResult:
     return CheckResult(
         check_key=check_key,
         status=status,
-        observed_at=datetime.now(UTC),
+        observed_at=_OBSERVED_AT,
         latency_ms=latency_ms,
     )
 
 
-def test_check_result_score_mapping() -> None:
-    assert check_result_score(_result("a", "up")) == 100.0
-    assert check_result_score(_result("a", "down")) == 0.0
-    assert check_result_score(_result("a", "degraded", 400)) == 80.0
-    assert check_result_score(_result("a", "degraded", 900)) == 65.0
-    assert check_result_score(_result("a", "degraded", 1900)) == 45.0
+@pytest.mark.parametrize(
+    ("status", "latency_ms", "expected_score"),
+    [
+        ("up", None, 100.0),
+        ("up", 5_000, 100.0),
+        ("down", None, 0.0),
+        ("degraded", None, 60.0),
+        ("degraded", 400, 80.0),
+        ("degraded", 500, 80.0),
+        ("degraded", 501, 65.0),
+        ("degraded", 900, 65.0),
+        ("degraded", 1000, 65.0),
+        ("degraded", 1001, 45.0),
+        ("degraded", 1900, 45.0),
+    ],
+)
+def test_check_result_score_mapping(status: str, latency_ms: int | None, expected_score: float) -> None:
+    assert check_result_score(_result("a", status, latency_ms)) == expected_score
 
 
 def test_weighted_service_score_uses_weights() -> None:
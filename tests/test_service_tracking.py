@@ -1,9 +1,13 @@
 from datetime import UTC, datetime
 
+import pytest
+
 from is_it_down.api.bigquery_store import _sort_service_summaries_by_views
 from is_it_down.api.schemas import ServiceSummary
 from is_it_down.api.service_tracking_middleware import _service_slug_from_path
 
+_OBSERVED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 def _summary(slug: str) -> ServiceSummary:
     return ServiceSummary(
@@ -14,7 +18,7 @@ def _summary(slug: str) -> ServiceSummary:
         status="up",
         raw_score=100.0,
         effective_score=100.0,
-        observed_at=datetime.now(UTC),
+        observed_at=_OBSERVED_AT,
         dependency_impacted=False,
         attribution_confidence=0.0,
         probable_root_service_id=None,
@@ -38,12 +42,28 @@ def test_sort_service_summaries_falls_back_to_slug_when_views_tie() -> None:
     assert [summary.slug for summary in sorted_summaries] == ["github", "gitlab", "vercel"]
 
 
-def test_service_slug_from_path_matches_detail_path_only() -> None:
-    assert _service_slug_from_path("/v1/services/gitlab") == "gitlab"
-    assert _service_slug_from_path("/v1/services/gitlab/") == "gitlab"
+@pytest.mark.slow
+def test_sort_service_summaries_orders_large_lists_by_views_then_slug() -> None:
+    summaries = [_summary(f"service-{index:05d}") for index in reversed(range(10_000))]
+    view_counts = {summary.slug: index % 7 for index, summary in enumerate(summaries) if index % 3}
+
+    sorted_summaries = _sort_service_summaries_by_views(summaries, view_counts)
+
+    expected = sorted(summaries, key=lambda summary: (-view_counts.get(summary.slug, 0), summary.slug))
+    assert [summary.slug for summary in sorted_summaries] == [summary.slug for summary in expected]
+
 
-    assert _service_slug_from_path("/v1/services") is None
-    assert _service_slug_from_path("/v1/services/uptime") is None
-    assert _service_slug_from_path("/v1/services/checker-trends") is None
-    assert _service_slug_from_path("/v1/services/gitlab/history") is None
-    assert _service_slug_from_path("/v1/incidents") is None
+@pytest.mark.parametrize(
+    ("path", "expected_slug"),
+    [
+        ("/v1/services/gitlab", "gitlab"),
+        ("/v1/services/gitlab/", "gitlab"),
+        ("/v1/services", None),
+        ("/v1/services/uptime", None),
+        ("/v1/services/checker-trends", None),
+        ("/v1/services/gitlab/history", None),
+        ("/v1/incidents", None),
+    ],
+)
+def test_service_slug_from_path_matches_detail_path_only(path: str, expected_slug: str | None) -> None:
+    assert _service_slug_from_path(path) == expected_slug
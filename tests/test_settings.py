@@ -0,0 +1,43 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from is_it_down.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _isolated_settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("IS_IT_DOWN_LOG_LEVEL", raising=False)
+    (tmp_path / ".env").write_text("IS_IT_DOWN_LOG_LEVEL=DEBUG\n")
+    (tmp_path / "custom.env").write_text("IS_IT_DOWN_LOG_LEVEL=WARNING\n")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_get_settings_reads_default_env_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("IS_IT_DOWN_ENV_FILE", raising=False)
+
+    assert get_settings().log_level == "DEBUG"
+
+
+def test_get_settings_reads_configured_env_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IS_IT_DOWN_ENV_FILE", "custom.env")
+
+    assert get_settings().log_level == "WARNING"
+
+
+def test_get_settings_skips_env_file_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IS_IT_DOWN_ENV_FILE", "")
+
+    assert get_settings().log_level == "INFO"
+
+
+def test_settings_are_read_only() -> None:
+    settings = get_settings()
+
+    with pytest.raises(ValidationError):
+        settings.log_level = "DEBUG"  # type: ignore[misc]
@@ -5,24 +5,23 @@ import pytest
 from is_it_down.core.time import parse_history_window
 
 
-def test_parse_hours() -> None:
-    assert parse_history_window("24h") == timedelta(hours=24)
-
-
-def test_parse_days() -> None:
-    assert parse_history_window("7d") == timedelta(days=7)
-
-
-def test_parse_minutes() -> None:
-    assert parse_history_window("15m") == timedelta(minutes=15)
-
-
-def test_parse_window_rejects_bad_values() -> None:
-    with pytest.raises(ValueError):
-        parse_history_window("0h")
-
-    with pytest.raises(ValueError):
-        parse_history_window("abc")
-
-    with pytest.raises(ValueError):
-        parse_history_window("10x")
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [("24h", timedelta(hours=24)), ("7d", timedelta(days=7)), ("15m", timedelta(minutes=15))],
+)
+def test_parse_history_window(spec: str, expected: timedelta) -> None:
+    assert parse_history_window(spec) == expected
+
+
+@pytest.mark.parametrize(
+    ("spec", "message"),
+    [
+        ("0h", "greater than zero"),
+        ("abc", "start with an integer"),
+        ("10x", "end with h, d, or m"),
+        ("", "start with an integer"),
+    ],
+)
+def test_parse_window_rejects_bad_values(spec: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_history_window(spec)
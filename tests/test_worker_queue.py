@@ -0,0 +1,13 @@
+import pytest
+
+from is_it_down.worker.queue import retry_delay_seconds
+
+
+@pytest.mark.parametrize(
+    ("attempt", "expected_base"),
+    [(0, 1), (1, 1), (2, 2), (3, 4), (6, 32), (7, 60), (8, 60), (50, 60)],
+)
+def test_retry_delay_seconds_backs_off_exponentially_with_cap(attempt: int, expected_base: int) -> None:
+    delay = retry_delay_seconds(attempt)
+
+    assert expected_base <= delay <= expected_base + 0.5
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import pytest
+
+from is_it_down.checkers.base import BaseCheck
+from is_it_down.core.models import CheckResult
+from is_it_down.db.models import ServiceCheck
+from is_it_down.settings import get_settings
+from is_it_down.worker import service
+from is_it_down.worker.service import (
+    _LOCK_SERVICE_SNAPSHOTS_STMT,
+    ClaimedJob,
+    _checker_for,
+    _record_check_results,
+    _run_claimed_job,
+    close_worker_http_client,
+    get_worker_http_client,
+)
+
+
+class DummyCheck(BaseCheck):
+    check_key = "dummy_check"
+    endpoint_key = "dummy://endpoint"
+
+    async def run(self, client: httpx.AsyncClient) -> CheckResult:
+        return CheckResult(check_key=self.check_key, status="up", observed_at=datetime.now(UTC))
+
+
+class HangingCheck(BaseCheck):
+    check_key = "hanging_check"
+    endpoint_key = "dummy://hanging"
+
+    async def run(self, client: httpx.AsyncClient) -> CheckResult:
+        raise AssertionError("execute is overridden")
+
+    async def execute(self, client: httpx.AsyncClient) -> CheckResult:
+        await asyncio.Event().wait()
+        raise AssertionError("the worker should time out first")
+
+
+DUMMY_CHECK_PATH = f"{DummyCheck.__module__}.{DummyCheck.__qualname__}"
+HANGING_CHECK_PATH = f"{HangingCheck.__module__}.{HangingCheck.__qualname__}"
+
+
+@pytest.fixture
+def _fresh_settings() -> Iterator[None]:
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+async def test_worker_http_client_is_shared_until_closed() -> None:
+    client = get_worker_http_client()
+    assert get_worker_http_client() is client
+
+    await close_worker_http_client()
+    assert client.is_closed
+
+    replacement = get_worker_http_client()
+    assert replacement is not client
+    await close_worker_http_client()
+
+
+async def test_close_worker_http_client_without_client_is_noop() -> None:
+    await close_worker_http_client()
+    await close_worker_http_client()
+
+
+def test_checker_for_reuses_instance_per_configuration() -> None:
+    checker = _checker_for(DUMMY_CHECK_PATH, 2.5, 0.5)
+
+    assert isinstance(checker, DummyCheck)
+    assert checker.timeout_seconds == 2.5
+    assert checker.weight == 0.5
+    assert _checker_for(DUMMY_CHECK_PATH, 2.5, 0.5) is checker
+    assert _checker_for(DUMMY_CHECK_PATH, 3.0, 0.5) is not checker
+
+
+@pytest.mark.usefixtures("_fresh_settings")
+async def test_run_claimed_job_caps_check_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IS_IT_DOWN_WORKER_MAX_CHECK_TIMEOUT_SECONDS", "0.01")
+    check = ServiceCheck(
+        id=1,
+        service_id=1,
+        check_key=HangingCheck.check_key,
+        class_path=HANGING_CHECK_PATH,
+        timeout_seconds=5.0,
+        weight=1.0,
+        enabled=True,
+    )
+
+    async with httpx.AsyncClient() as client:
+        outcome = await _run_claimed_job(
+            ClaimedJob(id=1, service_id=1, check_id=1, attempt=1),
+            check,
+            client=client,
+            per_service_semaphores=defaultdict(lambda: asyncio.Semaphore(1)),
+            global_semaphore=asyncio.Semaphore(1),
+        )
+
+    assert isinstance(outcome, CheckResult)
+    assert outcome.status == "down"
+    assert outcome.error_code == "TIMEOUT"
+    assert outcome.check_key == HangingCheck.check_key
+
+
+class _SnapshotStore:
+    def __init__(self) -> None:
+        self.locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.committed_runs: list[tuple[ClaimedJob, CheckResult]] = []
+        self.snapshots: list[dict[str, Any]] = []
+
+
+class _FakeWorkerSession:
+    # Models what the worker relies on: blocking advisory locks released on commit, and check runs
+    # that other transactions only see once committed.
+    def __init__(self, store: _SnapshotStore) -> None:
+        self.store = store
+        self.pending_runs: list[tuple[ClaimedJob, CheckResult]] = []
+        self.pending_snapshots: list[dict[str, Any]] = []
+        self.held: list[asyncio.Lock] = []
+
+    async def execute(self, statement: object, params: Any = None) -> None:
+        if statement is _LOCK_SERVICE_SNAPSHOTS_STMT:
+            for service_id in params["service_ids"]:
+                lock = self.store.locks[service_id]
+                await lock.acquire()
+                self.held.append(lock)
+        else:
+            self.pending_snapshots.extend(params)
+
+    async def commit(self) -> None:
+        self.store.committed_runs.extend(self.pending_runs)
+        self.store.snapshots.extend(self.pending_snapshots)
+        for lock in self.held:
+            lock.release()
+
+
+async def test_record_check_results_recomputes_overlapping_batches_with_both_visible(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = _SnapshotStore()
+
+    async def fake_insert_and_read_latest(
+        session: _FakeWorkerSession,
+        completed: Sequence[tuple[ClaimedJob, CheckResult]],
+        service_ids: Sequence[int],
+    ) -> dict[int, tuple[list[CheckResult], dict[str, float]]]:
+        session.pending_runs.extend(completed)
+        await asyncio.sleep(0)
+        visible = store.committed_runs + session.pending_runs
+        return {
+            service_id: ([result for job, result in visible if job.service_id == service_id], {})
+            for service_id in service_ids
+        }
+
+    async def fake_read_dependency_signals(session_factory: object, service_ids: Sequence[int]) -> dict[int, list]:
+        return {service_id: [] for service_id in service_ids}
+
+    async def fake_recompute(
+        session: _FakeWorkerSession, *, service_id: int, check_results: list[CheckResult], **_: object
+    ) -> dict[str, Any]:
+        return {"service_id": service_id, "check_keys": sorted(result.check_key for result in check_results)}
+
+    async def fake_mark_jobs_done(session: _FakeWorkerSession, job_ids: Sequence[int]) -> None:
+        return None
+
+    monkeypatch.setattr(service, "_insert_check_runs_and_read_latest", fake_insert_and_read_latest)
+    monkeypatch.setattr(service, "_read_dependency_signals", fake_read_dependency_signals)
+    monkeypatch.setattr(service, "_recompute_service_snapshot", fake_recompute)
+    monkeypatch.setattr(service, "mark_jobs_done", fake_mark_jobs_done)
+
+    async def run_batch(job_id: int, check_key: str) -> None:
+        session = _FakeWorkerSession(store)
+        result = CheckResult(check_key=check_key, status="down", observed_at=datetime.now(UTC))
+        await _record_check_results(
+            session,
+            [(ClaimedJob(id=job_id, service_id=1, check_id=job_id, attempt=1), result)],
+            session_factory=None,
+        )
+        await asyncio.sleep(0)
+        await session.commit()
+
+    await asyncio.gather(run_batch(1, "first"), run_batch(2, "second"))
+
+    assert [snapshot["service_id"] for snapshot in store.snapshots] == [1, 1]
+    assert store.snapshots[-1]["check_keys"] == ["first", "second"]